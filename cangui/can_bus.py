@@ -1,11 +1,13 @@
 from dataclasses import dataclass
-
-import can
+from typing import TYPE_CHECKING
 
 from cangui.can_message import CanMessage
 
+if TYPE_CHECKING:
+    import can
+
 
-@dataclass
+@dataclass(slots=True)
 class BusConfig:
     interface: str = "socketcan-virtual"
     channel: str = "vcan0"
@@ -29,13 +31,14 @@ class BusConfig:
 class CanBus:
     def __init__(self, config: BusConfig):
         self.config = config
-        self._bus: can.Bus | None = None
+        self._bus: "can.Bus | None" = None
 
     @property
     def is_connected(self) -> bool:
         return self._bus is not None
 
     def connect(self):
+        import can
         self._bus = can.Bus(
             interface=self.config.can_interface,
             channel=self.config.channel,
@@ -71,9 +74,27 @@ class CanBus:
             channel=self.config.channel,
         )
 
+    def recv_batch(self, max_count: int, timeout: float = 0.1) -> list[CanMessage]:
+        """Wait up to timeout for one frame, then drain frames already queued.
+
+        Draining with a zero timeout keeps the socket buffer emptied at kernel
+        rate instead of paying the caller's loop overhead per frame.
+        """
+        msg = self.recv(timeout=timeout)
+        if msg is None:
+            return []
+        batch = [msg]
+        while len(batch) < max_count:
+            msg = self.recv(timeout=0.0)
+            if msg is None:
+                break
+            batch.append(msg)
+        return batch
+
     def send(self, msg: CanMessage):
         if self._bus is None:
             return
+        import can
         data = msg.data[:msg.dlc] if msg.dlc else msg.data
         can_msg = can.Message(
             arbitration_id=msg.arbitration_id,
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 import time
 
 
-@dataclass
+@dataclass(slots=True)
 class CanMessage:
     arbitration_id: int
     data: bytes
@@ -15,12 +15,18 @@ class CanMessage:
     timestamp: float = field(default_factory=time.time)
     bus: int = 1
     channel: str = ""
+    # Lazily formatted display strings (messages are not mutated after creation)
+    _id_hex: str | None = field(default=None, init=False, repr=False, compare=False)
+    _data_hex: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def id_hex(self) -> str:
-        if self.is_extended_id:
-            return f"{self.arbitration_id:08X}"
-        return f"{self.arbitration_id:03X}"
+        if self._id_hex is None:
+            if self.is_extended_id:
+                self._id_hex = f"{self.arbitration_id:08X}"
+            else:
+                self._id_hex = f"{self.arbitration_id:03X}"
+        return self._id_hex
 
     @property
     def frame_type(self) -> str:
@@ -34,4 +40,6 @@ class CanMessage:
 
     @property
     def data_hex(self) -> str:
-        return " ".join(f"{b:02X}" for b in self.data)
+        if self._data_hex is None:
+            self._data_hex = self.data.hex(" ").upper()
+        return self._data_hex
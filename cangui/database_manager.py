@@ -41,6 +41,10 @@ class DatabaseManager:
         elif suffix in (".odx", ".pdx", ".odx-d"):
             self._odx.remove_file(path)
 
+    @property
+    def known_ids(self) -> frozenset[int]:
+        return self._dbc.known_ids
+
     def decode(self, arb_id: int, data: bytes) -> dict[str, object] | None:
         return self._dbc.decode(arb_id, data)
 
@@ -56,6 +60,9 @@ class DatabaseManager:
     def get_signal_unit(self, arb_id: int, signal_name: str) -> str:
         return self._dbc.get_signal_unit(arb_id, signal_name)
 
+    def get_signal_units(self, arb_id: int) -> dict[str, str]:
+        return self._dbc.get_signal_units(arb_id)
+
     def clear(self):
         self._dbc.clear()
         self._odx.clear()
@@ -1,57 +1,69 @@
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cantools.database import Database, Message
+if TYPE_CHECKING:
+    from cantools.database import Database, Message
 
 
 class DbcManager:
     """Manages DBC/KCD database files using cantools."""
 
     def __init__(self):
-        self._db = Database()
-        self._files: list[Path] = []
+        # One parsed Database per file so removing a file never re-parses the rest
+        self._dbs: "dict[Path, Database]" = {}
+        self._messages: "list[Message]" = []
+        self._id_to_msg: "dict[int, Message]" = {}
+        self._name_to_msg: "dict[str, Message]" = {}
+        self._known_ids: frozenset[int] = frozenset()
+        self._unit_cache: dict[int, dict[str, str]] = {}
 
     @property
     def files(self) -> list[Path]:
-        return list(self._files)
-
-    @property
-    def database(self) -> Database:
-        return self._db
+        return list(self._dbs)
 
     def load_file(self, path: str | Path) -> list[str]:
         """Load a DBC/KCD file. Returns list of message names added."""
         path = Path(path)
-        if path in self._files:
+        if path in self._dbs:
             return []
-        self._db.add_dbc_file(str(path))
-        self._files.append(path)
-        return [m.name for m in self._db.messages]
+        import cantools
+        # CANTOOLS_CACHE_DIR enables cantools' on-disk cache of parsed files
+        db = cantools.database.load_file(
+            str(path), cache_dir=os.environ.get("CANTOOLS_CACHE_DIR"))
+        self._dbs[path] = db
+        self._rebuild_index()
+        return [m.name for m in db.messages]
 
     def remove_file(self, path: str | Path):
-        """Remove a loaded file by rebuilding the database without it."""
+        """Remove a loaded file and drop its messages from the merged index."""
         path = Path(path)
-        if path not in self._files:
+        if self._dbs.pop(path, None) is None:
             return
-        self._files.remove(path)
-        self._db = Database()
-        for f in self._files:
-            self._db.add_dbc_file(str(f))
+        self._rebuild_index()
 
-    def get_message_by_id(self, arb_id: int) -> Message | None:
-        try:
-            return self._db.get_message_by_frame_id(arb_id)
-        except KeyError:
-            return None
+    def _rebuild_index(self):
+        """Merge messages of all loaded files; later files win on duplicate IDs."""
+        self._messages = [m for db in self._dbs.values() for m in db.messages]
+        self._id_to_msg = {m.frame_id: m for m in self._messages}
+        self._name_to_msg = {m.name: m for m in self._messages}
+        self._known_ids = frozenset(self._id_to_msg)
+        self._unit_cache.clear()
 
-    def get_message_by_name(self, name: str) -> Message | None:
-        try:
-            return self._db.get_message_by_name(name)
-        except KeyError:
-            return None
+    @property
+    def known_ids(self) -> frozenset[int]:
+        """Frame IDs defined by any loaded file, for cheap per-frame filtering."""
+        return self._known_ids
+
+    def get_message_by_id(self, arb_id: int) -> "Message | None":
+        return self._id_to_msg.get(arb_id)
+
+    def get_message_by_name(self, name: str) -> "Message | None":
+        return self._name_to_msg.get(name)
 
     def decode(self, arb_id: int, data: bytes) -> dict[str, object] | None:
         """Decode raw CAN data to signal name->value dict."""
-        msg_def = self.get_message_by_id(arb_id)
+        msg_def = self._id_to_msg.get(arb_id)
         if msg_def is None:
             return None
         try:
@@ -61,7 +73,7 @@ class DbcManager:
 
     def encode(self, arb_id: int, signal_data: dict[str, object]) -> bytes | None:
         """Encode signal values into raw CAN data."""
-        msg_def = self.get_message_by_id(arb_id)
+        msg_def = self._id_to_msg.get(arb_id)
         if msg_def is None:
             return None
         try:
@@ -69,19 +81,25 @@ class DbcManager:
         except Exception:
             return None
 
+    def get_signal_units(self, arb_id: int) -> dict[str, str]:
+        """Signal name -> unit for one message, cached until files change."""
+        units = self._unit_cache.get(arb_id)
+        if units is None:
+            units = {}
+            msg_def = self._id_to_msg.get(arb_id)
+            if msg_def is not None:
+                for sig in msg_def.signals:
+                    units.setdefault(sig.name, sig.unit or "")
+            self._unit_cache[arb_id] = units
+        return units
+
     def get_signal_unit(self, arb_id: int, signal_name: str) -> str:
-        msg_def = self.get_message_by_id(arb_id)
-        if msg_def is None:
-            return ""
-        for sig in msg_def.signals:
-            if sig.name == signal_name:
-                return sig.unit or ""
-        return ""
+        return self.get_signal_units(arb_id).get(signal_name, "")
 
     @property
-    def messages(self) -> list[Message]:
-        return list(self._db.messages)
+    def messages(self) -> "list[Message]":
+        return list(self._messages)
 
     def clear(self):
-        self._db = Database()
-        self._files.clear()
+        self._dbs.clear()
+        self._rebuild_index()
@@ -1,3 +1,4 @@
+import struct
 from dataclasses import dataclass
 
 
@@ -11,8 +12,36 @@ DTC_STATUS_TEST_FAILED_SINCE_CLEAR = 0x20
 DTC_STATUS_TEST_NOT_COMPLETED_THIS_CYCLE = 0x40
 DTC_STATUS_WARNING_INDICATOR = 0x80
 
+_DTC_PREFIXES = ("P", "C", "B", "U")
 
-@dataclass
+# Letter and first two digits of the display code depend only on the
+# high byte of the DTC, so all 256 variants are formatted up front
+_CODE_DISPLAY_PREFIX = tuple(
+    f"{_DTC_PREFIXES[(b >> 6) & 0x03]}{(b >> 4) & 0x03}{b & 0x0F:01X}"
+    for b in range(256)
+)
+
+# Display labels in the order they are shown, not bit order
+_STATUS_LABELS = (
+    (DTC_STATUS_TEST_FAILED, "Active"),
+    (DTC_STATUS_CONFIRMED, "Confirmed"),
+    (DTC_STATUS_PENDING, "Pending"),
+    (DTC_STATUS_WARNING_INDICATOR, "Warning"),
+    (DTC_STATUS_TEST_FAILED_SINCE_CLEAR, "FailedSinceClear"),
+)
+
+
+def _format_status_text(status: int) -> str:
+    parts = [label for mask, label in _STATUS_LABELS if status & mask]
+    return ", ".join(parts) if parts else "Inactive"
+
+
+# The status byte has only 256 values, so its strings are built once
+_STATUS_TEXT = tuple(_format_status_text(s) for s in range(256))
+_STATUS_BITS = tuple(f"{s:08b}" for s in range(256))
+
+
+@dataclass(frozen=True, slots=True)
 class Dtc:
     code: int  # 3-byte DTC code
     status: int  # Status byte
@@ -24,13 +53,7 @@ class Dtc:
     @property
     def code_display(self) -> str:
         """Format as standard DTC string (e.g., P0123, C0456, B0789, U0ABC)."""
-        first_byte = (self.code >> 16) & 0xFF
-        prefix_bits = (first_byte >> 6) & 0x03
-        prefix = ["P", "C", "B", "U"][prefix_bits]
-        second_digit = (first_byte >> 4) & 0x03
-        remaining = self.code & 0x0FFF
-        third_digit = (first_byte) & 0x0F
-        return f"{prefix}{second_digit}{third_digit:01X}{remaining:03X}"
+        return _CODE_DISPLAY_PREFIX[(self.code >> 16) & 0xFF] + f"{self.code & 0x0FFF:03X}"
 
     @property
     def is_active(self) -> bool:
@@ -46,22 +69,30 @@ class Dtc:
 
     @property
     def status_text(self) -> str:
-        parts = []
-        if self.status & DTC_STATUS_TEST_FAILED:
-            parts.append("Active")
-        if self.status & DTC_STATUS_CONFIRMED:
-            parts.append("Confirmed")
-        if self.status & DTC_STATUS_PENDING:
-            parts.append("Pending")
-        if self.status & DTC_STATUS_WARNING_INDICATOR:
-            parts.append("Warning")
-        if self.status & DTC_STATUS_TEST_FAILED_SINCE_CLEAR:
-            parts.append("FailedSinceClear")
-        return ", ".join(parts) if parts else "Inactive"
+        return _STATUS_TEXT[self.status & 0xFF]
 
     @property
     def status_bits(self) -> str:
-        return f"{self.status:08b}"
+        return _STATUS_BITS[self.status & 0xFF]
+
+
+_RECORD = struct.Struct(">I")  # 3 bytes DTC code + 1 byte status
+
+
+def _parse_records(data: bytes, offset: int = 0) -> list[Dtc]:
+    """Parse 4-byte DTC records starting at offset.
+
+    Records are unpacked as big-endian words from a memoryview, so no slice of
+    the payload is copied. All-zero codes and a trailing partial record are
+    skipped.
+    """
+    view = memoryview(data)[offset:]
+    view = view[:len(view) & ~3]
+    return [
+        Dtc(code=word >> 8, status=word & 0xFF)
+        for (word,) in _RECORD.iter_unpack(view)
+        if word >> 8
+    ]
 
 
 class DtcManager:
@@ -73,27 +104,11 @@ class DtcManager:
         Response format: [service_id, sub_function, status_availability_mask,
                           DTC_high, DTC_mid, DTC_low, status, ...]
         """
-        dtcs = []
         if len(data) < 4:
-            return dtcs
+            return []
         # Skip service ID (0x59), sub-function, and availability mask
-        payload = data[3:]
-        # Each DTC record is 4 bytes: 3 bytes DTC code + 1 byte status
-        while len(payload) >= 4:
-            code = (payload[0] << 16) | (payload[1] << 8) | payload[2]
-            status = payload[3]
-            if code != 0:  # Skip all-zero DTCs
-                dtcs.append(Dtc(code=code, status=status))
-            payload = payload[4:]
-        return dtcs
+        return _parse_records(data, offset=3)
 
     def parse_raw(self, data: bytes) -> list[Dtc]:
         """Parse DTC records from raw 4-byte-per-DTC data (no header)."""
-        dtcs = []
-        while len(data) >= 4:
-            code = (data[0] << 16) | (data[1] << 8) | data[2]
-            status = data[3]
-            if code != 0:
-                dtcs.append(Dtc(code=code, status=status))
-            data = data[4:]
-        return dtcs
+        return _parse_records(data)
@@ -0,0 +1,33 @@
+import json
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _default(obj):
+    # Shallow per-level mapping; json recurses into nested dataclasses itself
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(path: str | Path, obj) -> None:
+    """Write obj to path as indented JSON. Dataclass instances are written
+    as objects of their fields without an asdict() deep copy."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(obj, f, indent=2, default=_default)
+
+
+def load_json(path: str | Path):
+    """Read a JSON document from path."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path) as f:
+        return json.load(f)
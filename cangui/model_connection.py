@@ -1,22 +1,52 @@
+import sys
+
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QStyledItemDelegate, QComboBox
 
 from cangui.can_bus import BusConfig
 from cangui.service_can import CanService
 
-INTERFACES = [
+# Interned so the delegate can hand these exact objects through to setData
+INTERFACES = tuple(sys.intern(s) for s in (
     "socketcan-virtual", "socketcan", "pcan", "ixxat", "kvaser", "vector", "virtual",
-]
+))
 
-DEFAULT_CHANNELS = {
+DEFAULT_CHANNELS = {sys.intern(k): sys.intern(v) for k, v in {
     "socketcan-virtual": "vcan0",
     "socketcan": "can0",
     "pcan": "PCAN_USBBUS1",
     "vector": "0",
-}
+}.items()}
 
 BITRATES = [125000, 250000, 500000, 1000000]
 
+_BITRATE_DISPLAY = {b: f"{b // 1000} kbit/s" for b in BITRATES}
+
+_COLOR_OK = QColor("green")
+_COLOR_ERROR = QColor("red")
+
+# Per-column value getters (ConnectionInfo -> value), indexed by column
+_DISPLAY_GETTERS = (
+    None,
+    lambda c: c.config.bus_number,
+    lambda c: c.name,
+    lambda c: c.config.channel,
+    lambda c: c.config.interface,
+    lambda c: (_BITRATE_DISPLAY.get(c.config.bitrate)
+               or f"{c.config.bitrate // 1000} kbit/s"),
+    lambda c: c.status,
+    lambda c: c.overruns,
+    lambda c: c.qxmt_fulls,
+    lambda c: "EF" if not c.config.fd else "FD",
+    lambda c: "",
+)
+_EDIT_GETTERS = (
+    *_DISPLAY_GETTERS[:5],
+    lambda c: c.config.bitrate,
+    *_DISPLAY_GETTERS[6:],
+)
+
 
 class InterfaceDelegate(QStyledItemDelegate):
     """Dropdown delegate for the Interface column."""
@@ -33,7 +63,9 @@ class InterfaceDelegate(QStyledItemDelegate):
             editor.setCurrentIndex(idx)
 
     def setModelData(self, editor, model, index):
-        model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+        idx = editor.currentIndex()
+        value = INTERFACES[idx] if 0 <= idx < len(INTERFACES) else editor.currentText()
+        model.setData(index, value, Qt.ItemDataRole.EditRole)
 
 
 class ConnectionModel(QAbstractTableModel):
@@ -69,37 +101,18 @@ class ConnectionModel(QAbstractTableModel):
         if role == Qt.ItemDataRole.CheckStateRole and col == 0:
             return Qt.CheckState.Checked if conn.bus.is_connected else Qt.CheckState.Unchecked
 
-        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
-            match col:
-                case 1:
-                    return conn.config.bus_number
-                case 2:
-                    return conn.name
-                case 3:
-                    return conn.config.channel
-                case 4:
-                    return conn.config.interface
-                case 5:
-                    if role == Qt.ItemDataRole.EditRole:
-                        return conn.config.bitrate
-                    return f"{conn.config.bitrate // 1000} kbit/s"
-                case 6:
-                    return conn.status
-                case 7:
-                    return conn.overruns
-                case 8:
-                    return conn.qxmt_fulls
-                case 9:
-                    return "EF" if not conn.config.fd else "FD"
-                case 10:
-                    return ""
+        if role == Qt.ItemDataRole.DisplayRole:
+            getter = _DISPLAY_GETTERS[col]
+            return getter(conn) if getter is not None else None
+        if role == Qt.ItemDataRole.EditRole:
+            getter = _EDIT_GETTERS[col]
+            return getter(conn) if getter is not None else None
 
         if role == Qt.ItemDataRole.ForegroundRole and col == 6:
-            from PySide6.QtGui import QColor
             if conn.status == "OK":
-                return QColor("green")
+                return _COLOR_OK
             elif conn.status.startswith("Error"):
-                return QColor("red")
+                return _COLOR_ERROR
 
         return None
 
@@ -138,7 +151,7 @@ class ConnectionModel(QAbstractTableModel):
                 case 3:
                     conn.config.channel = str(value)
                 case 4:
-                    new_iface = str(value)
+                    new_iface = value if isinstance(value, str) else str(value)
                     conn.config.interface = new_iface
                     default_ch = DEFAULT_CHANNELS.get(new_iface)
                     if default_ch:
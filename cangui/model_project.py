@@ -1,3 +1,5 @@
+import os
+import stat
 from pathlib import Path
 
 from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex, QTimer
@@ -12,18 +14,28 @@ class ProjectNode:
         self.path = path
         self.parent = parent
         self.children: list[ProjectNode] = []
+        self._row = 0  # position in parent.children, kept in sync by the parent
 
     def add_child(self, node: "ProjectNode"):
         node.parent = self
+        node._row = len(self.children)
         self.children.append(node)
 
+    def insert_child(self, row: int, node: "ProjectNode"):
+        node.parent = self
+        self.children.insert(row, node)
+        for i in range(row, len(self.children)):
+            self.children[i]._row = i
+
     def remove_child(self, row: int):
         if 0 <= row < len(self.children):
             self.children.pop(row)
+            for i in range(row, len(self.children)):
+                self.children[i]._row = i
 
     def row(self) -> int:
         if self.parent:
-            return self.parent.children.index(self)
+            return self._row
         return 0
 
 
@@ -32,6 +44,8 @@ class ProjectModel(QAbstractItemModel):
         super().__init__(parent)
         self._project = project
         self._root = ProjectNode("root")
+        # path -> (size, mtime, display text) of regular files, refreshed by the size timer
+        self._size_cache: dict[str, tuple[int, float, str]] = {}
         self._rebuild()
 
         self._size_timer = QTimer(self)
@@ -39,37 +53,100 @@ class ProjectModel(QAbstractItemModel):
         self._size_timer.timeout.connect(self._refresh_sizes)
         self._size_timer.start()
 
+    def _file_groups(self) -> list[tuple[str, list[str]]]:
+        """Non-empty (group name, file list) pairs in display order."""
+        data = self._project.data
+        groups = [
+            ("Databases", data.database_files),
+            ("Traces", data.trace_files),
+            ("Plot Traces", data.plot_files),
+        ]
+        return [(name, files) for name, files in groups if files]
+
     def _rebuild(self):
         self.beginResetModel()
         self._root = ProjectNode("root")
         proj_node = ProjectNode(self._project.name)
         self._root.add_child(proj_node)
 
-        # Database files
-        if self._project.data.database_files:
-            db_group = ProjectNode("Databases")
-            proj_node.add_child(db_group)
-            for f in self._project.data.database_files:
-                db_group.add_child(ProjectNode(Path(f).name, path=f))
-
-        # Trace files
-        if self._project.data.trace_files:
-            trace_group = ProjectNode("Traces")
-            proj_node.add_child(trace_group)
-            for f in self._project.data.trace_files:
-                trace_group.add_child(ProjectNode(Path(f).name, path=f))
-
-        # Plot trace files
-        if self._project.data.plot_files:
-            plot_group = ProjectNode("Plot Traces")
-            proj_node.add_child(plot_group)
-            for f in self._project.data.plot_files:
-                plot_group.add_child(ProjectNode(Path(f).name, path=f))
+        for name, files in self._file_groups():
+            group = ProjectNode(name)
+            proj_node.add_child(group)
+            for f in files:
+                group.add_child(ProjectNode(Path(f).name, path=f))
 
+        self._size_cache.clear()
+        self._stat_tree(self._root)
         self.endResetModel()
 
+    @staticmethod
+    def _stat_file(path: str) -> tuple[int, float] | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return st.st_size, st.st_mtime
+
+    def _stat_tree(self, node: ProjectNode):
+        for child in node.children:
+            if child.path:
+                self._store_size(child.path, self._stat_file(child.path))
+            self._stat_tree(child)
+
+    def _store_size(self, path: str, info: tuple[int, float] | None):
+        """Cache (size, mtime) with its display text; None drops the entry."""
+        if info is None:
+            self._size_cache.pop(path, None)
+        else:
+            self._size_cache[path] = (*info, self._format_size(info[0]))
+
     def refresh(self):
-        self._rebuild()
+        """Apply project changes as row inserts/removes, resetting only when
+        a group appears or disappears or files were reordered."""
+        proj_node = self._root.children[0]
+        groups = self._file_groups()
+        if [name for name, _ in groups] != [g.name for g in proj_node.children]:
+            self._rebuild()
+            return
+
+        proj_index = self.index(0, 0)
+        if proj_node.name != self._project.name:
+            proj_node.name = self._project.name
+            self.dataChanged.emit(proj_index, proj_index, [Qt.ItemDataRole.DisplayRole])
+
+        for row, (_, files) in enumerate(groups):
+            if not self._sync_group(proj_node.children[row], self.index(row, 0, proj_index), files):
+                self._rebuild()
+                return
+
+    def _sync_group(self, group: ProjectNode, group_index: QModelIndex, files: list[str]) -> bool:
+        """Remove and insert file rows so group matches files; False if a reset is needed."""
+        wanted = set(files)
+        if len(wanted) != len(files):
+            return False
+        kept = [c.path for c in group.children if c.path in wanted]
+        kept_set = set(kept)
+        if kept != [f for f in files if f in kept_set]:
+            return False
+
+        for row in range(len(group.children) - 1, -1, -1):
+            path = group.children[row].path
+            if path not in wanted:
+                self.beginRemoveRows(group_index, row, row)
+                group.remove_child(row)
+                self._size_cache.pop(path, None)
+                self.endRemoveRows()
+
+        for row, f in enumerate(files):
+            if row < len(group.children) and group.children[row].path == f:
+                continue
+            self.beginInsertRows(group_index, row, row)
+            group.insert_child(row, ProjectNode(Path(f).name, path=f))
+            self._store_size(f, self._stat_file(f))
+            self.endInsertRows()
+        return True
 
     def index(self, row, column, parent=QModelIndex()):
         if not self.hasIndex(row, column, parent):
@@ -125,26 +202,44 @@ class ProjectModel(QAbstractItemModel):
             if index.column() == 0:
                 return node.name
             if index.column() == 1 and node.path:
-                p = Path(node.path)
-                if p.is_file():
-                    return self._format_size(p.stat().st_size)
+                info = self._size_cache.get(node.path)
+                if info is not None:
+                    return info[2]
         return None
 
     def flags(self, index: QModelIndex):
         return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
 
     def _refresh_sizes(self):
-        """Emit dataChanged for the size column so file sizes update."""
+        """Re-stat project files and emit dataChanged where a file changed."""
         self._emit_size_changed(self._root, QModelIndex())
 
     def _emit_size_changed(self, node: ProjectNode, parent: QModelIndex):
+        # Changed sibling rows are reported as contiguous runs, one signal each
+        run_start = -1
         for row, child in enumerate(node.children):
+            changed = False
             if child.path:
-                idx = self.index(row, 1, parent)
-                self.dataChanged.emit(idx, idx)
+                info = self._stat_file(child.path)
+                cached = self._size_cache.get(child.path)
+                if info != (cached[:2] if cached is not None else None):
+                    self._store_size(child.path, info)
+                    changed = True
+            if changed:
+                if run_start < 0:
+                    run_start = row
+            elif run_start >= 0:
+                self._emit_size_run(run_start, row - 1, parent)
+                run_start = -1
             if child.children:
                 child_parent = self.index(row, 0, parent)
                 self._emit_size_changed(child, child_parent)
+        if run_start >= 0:
+            self._emit_size_run(run_start, len(node.children) - 1, parent)
+
+    def _emit_size_run(self, first: int, last: int, parent: QModelIndex):
+        self.dataChanged.emit(self.index(first, 1, parent), self.index(last, 1, parent),
+                              [Qt.ItemDataRole.DisplayRole])
 
     def get_node(self, index: QModelIndex) -> ProjectNode | None:
         if index.isValid():
@@ -1,6 +1,8 @@
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
 
 
@@ -9,7 +11,7 @@ class FilterAction(Enum):
     DROP = "Drop"
 
 
-@dataclass
+@dataclass(slots=True)
 class RxFilterRule:
     enabled: bool = True
     action: FilterAction = FilterAction.PASS
@@ -17,6 +19,16 @@ class RxFilterRule:
     id_to: int = 0x7FF
     bus: int = 0  # 0 = any bus
     name: str = ""
+    # Display text of id_from/id_to; call format_ids() after changing either
+    _from_str: str = field(default="", init=False, repr=False, compare=False)
+    _to_str: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.format_ids()
+
+    def format_ids(self):
+        self._from_str = f"0x{self.id_from:03X}"
+        self._to_str = f"0x{self.id_to:03X}"
 
     def matches(self, arb_id: int, bus: int) -> bool:
         if self.bus != 0 and self.bus != bus:
@@ -24,8 +36,30 @@ class RxFilterRule:
         return self.id_from <= arb_id <= self.id_to
 
 
+# Saved action strings, looked up without going through the enum's value descriptor
+_ACTION_STR = {FilterAction.PASS: "Pass", FilterAction.DROP: "Drop"}
+
 COLUMNS = ["", "Action", "Name", "CAN-ID From", "CAN-ID To", "Bus"]
 
+# Per-column value getters (RxFilterRule -> value), indexed by column
+_DISPLAY_GETTERS = (
+    None,
+    lambda r: r.action.value,
+    lambda r: r.name,
+    lambda r: r._from_str,
+    lambda r: r._to_str,
+    lambda r: r.bus if r.bus != 0 else "Any",
+)
+_EDIT_GETTERS = (
+    *_DISPLAY_GETTERS[:3],
+    lambda r: r._from_str[2:],
+    lambda r: r._to_str[2:],
+    lambda r: r.bus,
+)
+
+# Below this many enabled rules a straight scan beats the sorted-range index
+_BISECT_MIN_RULES = 16
+
 
 class RxFilterModel(QAbstractTableModel):
     """First-match filter table for incoming CAN messages.
@@ -45,6 +79,21 @@ class RxFilterModel(QAbstractTableModel):
             RxFilterRule(name="Extended", action=FilterAction.PASS,
                          id_from=0x800, id_to=0x1FFFFFFF),
         ]
+        # Columns of the enabled rules in table order, rebuilt on every change
+        self._id_from = np.empty(0, dtype=np.int64)
+        self._id_to = np.empty(0, dtype=np.int64)
+        self._bus = np.empty(0, dtype=np.int64)
+        self._pass = np.empty(0, dtype=bool)
+        # Enabled rules as (id_from, id_to, bus, passes) tuples in table order,
+        # plus an index sorted by id_from for per-frame lookups
+        self._compiled: list[tuple[int, int, int, bool]] = []
+        self._sorted_starts: list[int] = []
+        self._sorted_idx: list[int] = []
+        self._sorted_max_to: list[int] = []
+        # True when no enabled DROP rule can ever be the first match
+        self._accept_all = True
+        self.filters_changed.connect(self._compile_rules)
+        self._compile_rules()
 
     # -- Qt model interface --
 
@@ -70,24 +119,12 @@ class RxFilterModel(QAbstractTableModel):
         if role == Qt.ItemDataRole.CheckStateRole and col == 0:
             return Qt.CheckState.Checked if rule.enabled else Qt.CheckState.Unchecked
 
-        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
-            match col:
-                case 1:
-                    return rule.action.value
-                case 2:
-                    return rule.name
-                case 3:
-                    if role == Qt.ItemDataRole.EditRole:
-                        return f"{rule.id_from:03X}"
-                    return f"0x{rule.id_from:03X}"
-                case 4:
-                    if role == Qt.ItemDataRole.EditRole:
-                        return f"{rule.id_to:03X}"
-                    return f"0x{rule.id_to:03X}"
-                case 5:
-                    if rule.bus == 0:
-                        return "Any" if role == Qt.ItemDataRole.DisplayRole else 0
-                    return rule.bus
+        if role == Qt.ItemDataRole.DisplayRole:
+            getter = _DISPLAY_GETTERS[col]
+            return getter(rule) if getter is not None else None
+        if role == Qt.ItemDataRole.EditRole:
+            getter = _EDIT_GETTERS[col]
+            return getter(rule) if getter is not None else None
 
         return None
 
@@ -125,11 +162,13 @@ class RxFilterModel(QAbstractTableModel):
                 case 3:
                     try:
                         rule.id_from = int(str(value), 16)
+                        rule.format_ids()
                     except ValueError:
                         return False
                 case 4:
                     try:
                         rule.id_to = int(str(value), 16)
+                        rule.format_ids()
                     except ValueError:
                         return False
                 case 5:
@@ -183,26 +222,99 @@ class RxFilterModel(QAbstractTableModel):
 
     def accepts(self, arb_id: int, bus: int) -> bool:
         """Return True if the message should be passed through."""
-        for rule in self._rules:
-            if not rule.enabled:
+        if self._accept_all:
+            return True
+        rules = self._compiled
+        if len(rules) < _BISECT_MIN_RULES:
+            for id_from, id_to, rule_bus, passes in rules:
+                if id_from <= arb_id <= id_to and (rule_bus == 0 or rule_bus == bus):
+                    return passes
+            # No rule matched — pass by default
+            return True
+
+        # Candidates are rules with id_from <= arb_id; walk them from the
+        # highest start down until no earlier range can reach arb_id, and
+        # keep the match with the lowest table index (first-match semantics).
+        first = -1
+        max_to = self._sorted_max_to
+        for k in range(bisect_right(self._sorted_starts, arb_id) - 1, -1, -1):
+            if max_to[k] < arb_id:
+                break
+            idx = self._sorted_idx[k]
+            _, id_to, rule_bus, _ = rules[idx]
+            if arb_id <= id_to and (rule_bus == 0 or rule_bus == bus) \
+                    and (first < 0 or idx < first):
+                first = idx
+        if first < 0:
+            return True
+        return rules[first][3]
+
+    def accepts_batch(self, arb_ids: list[int], buses: list[int]) -> np.ndarray:
+        """Vectorized accepts() over a batch of frames; returns a bool mask."""
+        count = len(arb_ids)
+        if count == 0 or self._accept_all:
+            return np.ones(count, dtype=bool)
+        ids = np.asarray(arb_ids, dtype=np.int64)[:, None]
+        bus = np.asarray(buses, dtype=np.int64)[:, None]
+        # frames x rules match matrix; argmax picks the first matching rule
+        mask = ((self._id_from <= ids) & (ids <= self._id_to)
+                & ((self._bus == 0) | (self._bus == bus)))
+        first = mask.argmax(axis=1)
+        matched = mask[np.arange(count), first]
+        return np.where(matched, self._pass[first], True)
+
+    def _compile_rules(self):
+        enabled = [r for r in self._rules if r.enabled]
+        self._compiled = [
+            (r.id_from, r.id_to, r.bus, r.action == FilterAction.PASS) for r in enabled
+        ]
+        self._sorted_idx = sorted(range(len(enabled)), key=lambda i: enabled[i].id_from)
+        self._sorted_starts = [enabled[i].id_from for i in self._sorted_idx]
+        # Running maximum of id_to over the sorted order bounds the backward walk
+        self._sorted_max_to = []
+        running = -1
+        for i in self._sorted_idx:
+            running = max(running, enabled[i].id_to)
+            self._sorted_max_to.append(running)
+        self._id_from = np.array([r.id_from for r in enabled], dtype=np.int64)
+        self._id_to = np.array([r.id_to for r in enabled], dtype=np.int64)
+        self._bus = np.array([r.bus for r in enabled], dtype=np.int64)
+        self._pass = np.array([r.action == FilterAction.PASS for r in enabled], dtype=bool)
+        self._accept_all = self._drops_unreachable()
+
+    def _drops_unreachable(self) -> bool:
+        """True if every enabled DROP range is already covered by earlier any-bus PASS rules."""
+        covering: list[tuple[int, int]] = []
+        for id_from, id_to, rule_bus, passes in self._compiled:
+            if passes:
+                if rule_bus == 0:
+                    covering.append((id_from, id_to))
                 continue
-            if rule.matches(arb_id, bus):
-                return rule.action == FilterAction.PASS
-        # No rule matched — pass by default
+            # Walk the earlier PASS ranges in start order and check they span the DROP range
+            reach = id_from
+            for start, end in sorted(covering):
+                if start > reach:
+                    break
+                reach = max(reach, end + 1)
+                if reach > id_to:
+                    break
+            if reach <= id_to:
+                return False
         return True
 
     def to_dicts(self) -> list[dict]:
-        return [
-            {
+        action_str = _ACTION_STR
+        out = []
+        for r in self._rules:
+            out.append({
                 "enabled": r.enabled,
-                "action": r.action.value,
+                "action": action_str[r.action],
                 "id_from": r.id_from,
                 "id_to": r.id_to,
                 "bus": r.bus,
                 "name": r.name,
-            }
-            for r in self._rules
-        ]
+            })
+        return out
 
     def from_dicts(self, data: list[dict]):
         self.beginResetModel()
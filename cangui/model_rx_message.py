@@ -1,3 +1,5 @@
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex, QTimer
@@ -6,21 +8,29 @@ from PySide6.QtGui import QColor
 from cangui.can_message import CanMessage
 from cangui.signal_decoder import SignalDecoder
 from cangui.model_rx_filter import RxFilterModel
+from cangui.worker_signal_decoder import SignalDecodeWorker
 
 # Internal ID encoding:
 #   Top-level (message) rows: internalId = 0
-#   Child (signal) rows:      internalId = parent_row + 1
+#   Child (signal) rows:      internalId = parent_row | _IS_CHILD
 _TOP_LEVEL = 0
+_IS_CHILD = 1 << 31
+_ROW_MASK = _IS_CHILD - 1
 
+_COLOR_ERROR_FRAME = QColor(Qt.GlobalColor.red)
 
-@dataclass
+# Frames buffered between flushes; the oldest are dropped if the GUI thread stalls
+PENDING_CAP = 200_000
+
+
+@dataclass(slots=True)
 class SignalItem:
     name: str = ""
     value: str = ""
     unit: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RxMessageItem:
     bus: int = 0
     can_id: int = 0
@@ -35,6 +45,12 @@ class RxMessageItem:
     count: int = 0
     last_timestamp: float = 0.0
     signals: list[SignalItem] = field(default_factory=list)
+    # Display text, set on creation (ID) and once per flush (data)
+    can_id_str: str = ""
+    data_hex: str = ""
+    # Decoder compiled for this ID by SignalDecoder.compile(), None if undefined
+    _decode_fn: Callable[[bytes], list[tuple[str, str, str]]] | None = field(
+        default=None, repr=False, compare=False)
 
 
 COLUMNS = ["Bus", "CAN-ID (hex)", "Type", "Length", "Symbol",
@@ -47,17 +63,29 @@ class RxMessageModel(QAbstractItemModel):
         super().__init__(parent)
         self._items: list[RxMessageItem] = []
         self._id_to_row: dict[tuple[int, int], int] = {}  # (bus, arb_id) -> row
-        self._pending: list[CanMessage] = []
+        self._pending: deque[CanMessage] = deque(maxlen=PENDING_CAP)
         self._decoder = decoder
         self._filter = rx_filter
 
+        # Signals are decoded on a worker thread and applied in _apply_decoded
+        self._decode_worker = SignalDecodeWorker(self)
+        self._decode_worker.decoded.connect(self._apply_decoded)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._refresh_symbols_now)
+
+        # Single-shot, armed by the first message after a flush; idle buses cost nothing
         self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
         self._batch_timer.setInterval(50)
         self._batch_timer.timeout.connect(self._flush)
-        self._batch_timer.start()
 
     def set_decoder(self, decoder: SignalDecoder):
         self._decoder = decoder
+        for item in self._items:
+            item._decode_fn = decoder.compile(item.can_id)
 
     def index(self, row, column, parent=QModelIndex()):
         if not self.hasIndex(row, column, parent):
@@ -67,24 +95,24 @@ class RxMessageModel(QAbstractItemModel):
             return self.createIndex(row, column, _TOP_LEVEL)
         else:
             # Child signal row — encode parent's row
-            return self.createIndex(row, column, parent.row() + 1)
+            return self.createIndex(row, column, parent.row() | _IS_CHILD)
 
     def parent(self, index: QModelIndex):
         if not index.isValid():
             return QModelIndex()
         ptr = index.internalId()
-        if ptr == _TOP_LEVEL:
+        if not ptr & _IS_CHILD:
             # Already a top-level row
             return QModelIndex()
         # Child row — return parent as a top-level index
-        parent_row = ptr - 1
+        parent_row = ptr & _ROW_MASK
         return self.createIndex(parent_row, 0, _TOP_LEVEL)
 
     def rowCount(self, parent=QModelIndex()):
         if not parent.isValid():
             return len(self._items)
         # Only top-level items have children
-        if parent.internalId() == _TOP_LEVEL and 0 <= parent.row() < len(self._items):
+        if not parent.internalId() & _IS_CHILD and 0 <= parent.row() < len(self._items):
             return len(self._items[parent.row()].signals)
         return 0
 
@@ -96,44 +124,40 @@ class RxMessageModel(QAbstractItemModel):
             return COLUMNS[section]
         return None
 
-    def _is_top_level(self, index: QModelIndex) -> bool:
-        return index.internalId() == _TOP_LEVEL
-
     def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        # Views query many roles per cell; only these two carry data
+        if role != Qt.ItemDataRole.DisplayRole and role != Qt.ItemDataRole.ForegroundRole:
+            return None
         if not index.isValid():
             return None
+        ptr = index.internalId()
+        top = not ptr & _IS_CHILD
 
         if role == Qt.ItemDataRole.ForegroundRole:
-            if self._is_top_level(index) and 0 <= index.row() < len(self._items):
+            if top and 0 <= index.row() < len(self._items):
                 item = self._items[index.row()]
                 if item.is_error_frame:
-                    return QColor(Qt.GlobalColor.red)
-            return None
-
-        if role != Qt.ItemDataRole.DisplayRole:
+                    return _COLOR_ERROR_FRAME
             return None
 
         col = index.column()
 
-        if self._is_top_level(index):
+        if top:
             if index.row() >= len(self._items):
                 return None
             item = self._items[index.row()]
             match col:
                 case 0: return item.bus
-                case 1:
-                    if item.is_extended_id:
-                        return f"{item.can_id:08X}"
-                    return f"{item.can_id:03X}"
+                case 1: return item.can_id_str
                 case 2: return item.frame_type
                 case 3: return item.length
                 case 4: return item.symbol
-                case 5: return " ".join(f"{b:02X}" for b in item.raw_data[:item.length])
+                case 5: return item.data_hex
                 case 6: return item.timing_errors if item.timing_errors else ""
                 case 7: return f"{item.cycle_time_ms:.1f}" if item.cycle_time_ms else ""
                 case 8: return item.count
         else:
-            parent_row = index.internalId() - 1
+            parent_row = ptr & _ROW_MASK
             if parent_row >= len(self._items):
                 return None
             sigs = self._items[parent_row].signals
@@ -160,51 +184,73 @@ class RxMessageModel(QAbstractItemModel):
         if self._filter and not self._filter.accepts(msg.arbitration_id, msg.bus):
             return
         self._pending.append(msg)
+        if not self._batch_timer.isActive():
+            self._batch_timer.start()
 
     def on_messages(self, messages: list[CanMessage]):
+        batch = [msg for msg in messages if msg.is_rx]
         filt = self._filter
-        for msg in messages:
-            if not msg.is_rx:
+        if filt and batch:
+            keep = filt.accepts_batch([m.arbitration_id for m in batch],
+                                      [m.bus for m in batch])
+            batch = [msg for msg, ok in zip(batch, keep.tolist()) if ok]
+        self._pending.extend(batch)
+        if batch and not self._batch_timer.isActive():
+            self._batch_timer.start()
+
+    @staticmethod
+    def _update_signal_values(item: RxMessageItem,
+                              decoded: list[tuple[str, str, str]]) -> bool:
+        changed = False
+        for sig, (_, value, _) in zip(item.signals, decoded):
+            if sig.value != value:
+                sig.value = value
+                changed = True
+        return changed
+
+    @staticmethod
+    def _make_signals(decoded: list[tuple[str, str, str]]) -> list[SignalItem]:
+        return [SignalItem(name=name, value=value, unit=unit)
+                for name, value, unit in decoded]
+
+    def _apply_decoded(self, results: list):
+        """Apply worker results: (key, decoded tuples) per message row."""
+        # Rows come from _id_to_row and are valid, so indexes are created
+        # directly instead of through index()/hasIndex()
+        roles = [Qt.ItemDataRole.DisplayRole]
+        for key, decoded in results:
+            row = self._id_to_row.get(key)
+            if row is None or not decoded:
                 continue
-            if filt and not filt.accepts(msg.arbitration_id, msg.bus):
+            item = self._items[row]
+            old_count = len(item.signals)
+            if old_count == len(decoded):
+                if self._update_signal_values(item, decoded):
+                    child_id = row | _IS_CHILD
+                    self.dataChanged.emit(
+                        self.createIndex(0, 4, child_id),
+                        self.createIndex(old_count - 1, 5, child_id),
+                        roles,
+                    )
                 continue
-            self._pending.append(msg)
-
-    def _decode_signals(self, item: RxMessageItem):
-        """Decode signals from raw data using the signal decoder."""
-        if self._decoder is None:
-            return
-        decoded = self._decoder.decode(item.can_id, item.raw_data)
-        if not decoded:
-            return
-
-        if not item.symbol:
-            item.symbol = self._decoder.get_symbol(item.can_id)
-
-        new_signals = []
-        for ds in decoded:
-            new_signals.append(SignalItem(
-                name=ds.name,
-                value=ds.display_value,
-                unit=ds.unit,
-            ))
-
-        old_count = len(item.signals)
-        new_count = len(new_signals)
-
-        if old_count == new_count:
-            for i, sig in enumerate(new_signals):
-                item.signals[i].value = sig.value
-        else:
-            item.signals = new_signals
+            # Signal layout changed: replace the child rows
+            parent_idx = self.createIndex(row, 0, _TOP_LEVEL)
+            if old_count:
+                self.beginRemoveRows(parent_idx, 0, old_count - 1)
+                item.signals = []
+                self.endRemoveRows()
+            self.beginInsertRows(parent_idx, 0, len(decoded) - 1)
+            item.signals = self._make_signals(decoded)
+            self.endInsertRows()
 
     def _flush(self):
         if not self._pending:
             return
-        batch = self._pending
-        self._pending = []
+        batch = list(self._pending)
+        self._pending.clear()
 
         rows_to_update: set[int] = set()
+        decode_jobs = []
 
         for msg in batch:
             key = (msg.bus, msg.arbitration_id)
@@ -236,35 +282,47 @@ class RxMessageModel(QAbstractItemModel):
                     raw_data=msg.data,
                     count=1,
                     last_timestamp=msg.timestamp,
+                    can_id_str=(f"{msg.arbitration_id:08X}" if msg.is_extended_id
+                                else f"{msg.arbitration_id:03X}"),
+                    data_hex=msg.data[:msg.dlc].hex(" ").upper(),
                 )
                 if self._decoder:
                     item.symbol = self._decoder.get_symbol(msg.arbitration_id)
-                self._decode_signals(item)
+                    item._decode_fn = self._decoder.compile(msg.arbitration_id)
                 self._items.append(item)
                 self._id_to_row[key] = new_row
                 self.endInsertRows()
+                if item._decode_fn is not None:
+                    decode_jobs.append((key, item._decode_fn, item.raw_data))
 
-        # Decode signals once per updated row (not per message)
+        # Format and queue decoding once per updated row (not per message)
         for row in rows_to_update:
-            self._decode_signals(self._items[row])
+            item = self._items[row]
+            item.data_hex = item.raw_data[:item.length].hex(" ").upper()
+            if item._decode_fn is not None:
+                decode_jobs.append(((item.bus, item.can_id), item._decode_fn, item.raw_data))
+        if decode_jobs:
+            self._decode_worker.submit(decode_jobs)
 
         if rows_to_update:
-            min_row = min(rows_to_update)
-            max_row = max(rows_to_update)
-            self.dataChanged.emit(
-                self.index(min_row, 0),
-                self.index(max_row, self.columnCount() - 1),
-            )
-            # Also notify child signal rows
-            for row in rows_to_update:
-                item = self._items[row]
-                if item.signals:
-                    parent_idx = self.index(row, 0)
-                    self.dataChanged.emit(
-                        self.index(0, 0, parent_idx),
-                        self.index(len(item.signals) - 1,
-                                   self.columnCount() - 1, parent_idx),
-                    )
+            # One signal per contiguous run of rows, so untouched rows in
+            # between are not re-queried by the view
+            last_col = len(COLUMNS) - 1
+            create = self.createIndex
+            rows = sorted(rows_to_update)
+            start = prev = rows[0]
+            for row in rows[1:]:
+                if row != prev + 1:
+                    self.dataChanged.emit(create(start, 0, _TOP_LEVEL),
+                                          create(prev, last_col, _TOP_LEVEL))
+                    start = row
+                prev = row
+            self.dataChanged.emit(create(start, 0, _TOP_LEVEL),
+                                  create(prev, last_col, _TOP_LEVEL))
+
+    def stop(self):
+        """Stop the signal decode thread (call before the model is destroyed)."""
+        self._decode_worker.stop()
 
     def clear(self):
         self.beginResetModel()
@@ -276,20 +334,24 @@ class RxMessageModel(QAbstractItemModel):
     def get_item(self, index: QModelIndex) -> RxMessageItem | None:
         if not index.isValid():
             return None
-        if self._is_top_level(index):
+        iid = index.internalId()
+        if not iid & _IS_CHILD:
             if 0 <= index.row() < len(self._items):
                 return self._items[index.row()]
         else:
-            parent_row = index.internalId() - 1
+            parent_row = iid & _ROW_MASK
             if 0 <= parent_row < len(self._items):
                 return self._items[parent_row]
         return None
 
     def get_signal_at(self, index: QModelIndex) -> tuple[RxMessageItem, SignalItem] | None:
         """Get the signal item at an index, if it's a signal child row."""
-        if not index.isValid() or self._is_top_level(index):
+        if not index.isValid():
+            return None
+        iid = index.internalId()
+        if not iid & _IS_CHILD:
             return None
-        parent_row = index.internalId() - 1
+        parent_row = iid & _ROW_MASK
         if 0 <= parent_row < len(self._items):
             item = self._items[parent_row]
             if 0 <= index.row() < len(item.signals):
@@ -301,14 +363,25 @@ class RxMessageModel(QAbstractItemModel):
         return self._items
 
     def refresh_symbols(self):
-        """Re-resolve symbol names and signals after a DBC is loaded."""
+        """Re-resolve symbol names and signals after a DBC is loaded.
+
+        Debounced: bursts of calls within 100 ms result in one refresh.
+        """
+        self._refresh_timer.start()
+
+    def _refresh_symbols_now(self):
         if self._decoder is None:
             return
+        decode_jobs = []
         for item in self._items:
+            item._decode_fn = self._decoder.compile(item.can_id)
             sym = self._decoder.get_symbol(item.can_id)
             if sym:
                 item.symbol = sym
-            self._decode_signals(item)
+            if item._decode_fn is not None:
+                decode_jobs.append(((item.bus, item.can_id), item._decode_fn, item.raw_data))
+        if decode_jobs:
+            self._decode_worker.submit(decode_jobs)
         if self._items:
             self.dataChanged.emit(
                 self.index(0, 0),
@@ -1,16 +1,21 @@
+from array import array
 from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
+from time import monotonic_ns
 
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, Signal
+from PySide6.QtCore import Qt, QAbstractTableModel, QCoreApplication, QModelIndex, QTimer, Signal
 
 from cangui.can_message import CanMessage
 from cangui.signal_decoder import SignalDecoder
-from cangui.trace_writer import TraceWriter, TraceFormat, create_trace_writer
+from cangui.trace_writer import TraceFormat
+from cangui.worker_trace_writer import TraceDiskWriter
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceEntry:
     number: int
     timestamp: float
@@ -27,40 +32,125 @@ class TraceEntry:
 COLUMNS = ["#", "Time", "Bus", "CAN-ID", "Dir", "Type", "DLC", "Data", "Decoded"]
 
 DISPLAY_BUFFER_SIZE = 100_000
+# Formatted rows kept for repaints; only the viewport is ever formatted
+ROW_CACHE_SIZE = 1024
+# Frames buffered between flushes; the oldest are dropped if the GUI thread stalls
+PENDING_CAP = 200_000
 MAX_FILE_SIZE = 1_000_000_000  # 1 GB
 
 
+class _EntryColumns:
+    """Fixed-capacity ring of trace entries stored column-wise.
+
+    Numeric fields live in typed arrays so field-wise scans are contiguous;
+    slot (head + r) % capacity of every column holds view row r. Rows are
+    appended as tuples in TraceEntry field order.
+    """
+
+    __slots__ = ("capacity", "head", "size", "numbers", "timestamps", "buses",
+                 "can_ids", "extended", "directions", "frame_types", "dlcs",
+                 "data", "decoded", "_columns")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.head = 0
+        self.size = 0
+        self.numbers = array("Q", bytes(8 * capacity))
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.buses = array("H", bytes(2 * capacity))
+        self.can_ids = array("I", bytes(4 * capacity))
+        self.extended = array("B", bytes(capacity))
+        self.directions: list[str] = [""] * capacity
+        self.frame_types: list[str] = [""] * capacity
+        self.dlcs = array("B", bytes(capacity))
+        self.data: list[bytes] = [b""] * capacity
+        self.decoded: list[str] = [""] * capacity
+        # In TraceEntry field order
+        self._columns = (self.numbers, self.timestamps, self.buses, self.can_ids,
+                         self.extended, self.directions, self.frame_types, self.dlcs,
+                         self.data, self.decoded)
+
+    def slot(self, row: int) -> int:
+        return (self.head + row) % self.capacity
+
+    def extend(self, rows: list[tuple]):
+        """Append rows, overwriting the oldest once full."""
+        cap = self.capacity
+        if len(rows) > cap:
+            rows = rows[-cap:]
+        count = len(rows)
+        if count == 0:
+            return
+        start = (self.head + self.size) % cap
+        first = min(count, cap - start)
+        for column, values in zip(self._columns, zip(*rows)):
+            if isinstance(column, array):
+                head_part = array(column.typecode, values[:first])
+                tail_part = array(column.typecode, values[first:])
+            else:
+                head_part = values[:first]
+                tail_part = values[first:]
+            column[start:start + first] = head_part
+            column[:count - first] = tail_part
+        self.size += count
+        if self.size > cap:
+            self.head = (self.head + self.size - cap) % cap
+            self.size = cap
+
+    def display(self, slot: int) -> tuple:
+        """Format the entry in a slot into display values for COLUMNS."""
+        can_id = self.can_ids[slot]
+        return (
+            self.numbers[slot],
+            f"{self.timestamps[slot]:.3f}",
+            self.buses[slot],
+            f"{can_id:08X}" if self.extended[slot] else f"{can_id:03X}",
+            self.directions[slot],
+            self.frame_types[slot],
+            self.dlcs[slot],
+            self.data[slot].hex(" ").upper(),
+            self.decoded[slot],
+        )
+
+    def entry(self, row: int) -> TraceEntry:
+        i = self.slot(row)
+        return TraceEntry(self.numbers[i], self.timestamps[i], self.buses[i],
+                          self.can_ids[i], bool(self.extended[i]), self.directions[i],
+                          self.frame_types[i], self.dlcs[i], self.data[i], self.decoded[i])
+
+
 class TraceModel(QAbstractTableModel):
     file_changed = Signal(str)  # emitted with current trace file path
+    write_error = Signal(str)  # writing the trace file failed; disk recording has ended
     entries_committed = Signal()  # emitted after staged entries are committed to display
     rate_updated = Signal(int)  # messages per second
 
     def __init__(self, decoder: SignalDecoder | None = None, parent=None):
         super().__init__(parent)
-        self._entries: deque[TraceEntry] = deque(maxlen=DISPLAY_BUFFER_SIZE)
-        self._display_rows: deque[tuple] = deque(maxlen=DISPLAY_BUFFER_SIZE)
-        self._staged: list[tuple[TraceEntry, tuple]] = []
+        self._rows = _EntryColumns(DISPLAY_BUFFER_SIZE)
+        # Message number -> display tuple, filled by data(), oldest evicted first
+        self._row_cache: dict[int, tuple] = {}
+        self._staged: list[tuple] = []
         self._msg_number = 0
         self._start_time: float | None = None
-        self._pending: list[CanMessage] = []
-        self._pending_directions: list[str] = []
+        self._pending: deque[tuple[CanMessage, str]] = deque(maxlen=PENDING_CAP)
         self._recording = False
         self._decoder = decoder
 
         # Trace folder — set by main_window from project path
         self._trace_folder: Path | None = None
 
-        # Disk writer state
-        self._writer: TraceWriter | None = None
-        self._file_index = 0
-        self._base_name = ""
+        # Disk writer state; writes and file rolling run on a worker thread
+        self._disk_writer: TraceDiskWriter | None = None
+        self._current_file = ""
         self._trace_format = TraceFormat.TRC
 
-        # Fast timer: convert pending messages to TraceEntry objects (data capture)
+        # Fast timer: write pending messages to disk and stage rows (data capture).
+        # Single-shot, armed by the first message after a flush; idle buses cost nothing
         self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
         self._batch_timer.setInterval(50)
         self._batch_timer.timeout.connect(self._flush)
-        self._batch_timer.start()
 
         # Slow timer: commit staged entries to the model (screen update)
         self._view_timer = QTimer(self)
@@ -70,7 +160,7 @@ class TraceModel(QAbstractTableModel):
 
         # Rate tracking
         self._rate_count = 0
-        self._rate_window_start = 0.0
+        self._rate_window_start_ns = 0
 
     @property
     def recording(self) -> bool:
@@ -90,9 +180,7 @@ class TraceModel(QAbstractTableModel):
     @property
     def current_file(self) -> str:
         """Return the path of the current trace file, or empty string."""
-        if self._writer is not None:
-            return str(self._writer.path)
-        return ""
+        return self._current_file
 
     def flush_all(self):
         """Force all pending/staged data into entries (call before saving)."""
@@ -105,12 +193,16 @@ class TraceModel(QAbstractTableModel):
         return self._msg_number
 
     @property
-    def entries(self) -> deque[TraceEntry]:
-        return self._entries
+    def entries(self) -> Iterator[TraceEntry]:
+        """Displayed entries, oldest first, rebuilt from the row columns."""
+        rows = self._rows
+        for row in range(rows.size):
+            yield rows.entry(row)
 
     def start(self):
-        self._recording = True
+        """Start recording; raises OSError if the trace file cannot be opened."""
         self._open_trace_file()
+        self._recording = True
 
     def pause(self):
         self._recording = False
@@ -122,75 +214,59 @@ class TraceModel(QAbstractTableModel):
 
     def clear(self):
         self.beginResetModel()
-        self._entries.clear()
-        self._display_rows.clear()
+        self._rows = _EntryColumns(DISPLAY_BUFFER_SIZE)
+        self._row_cache.clear()
         self._staged.clear()
         self._msg_number = 0
         self._start_time = None
         self._pending.clear()
-        self._pending_directions.clear()
         self.endResetModel()
 
     def on_message(self, msg: CanMessage, direction: str = "Rx"):
         if not self._recording:
             return
-        self._pending.append(msg)
-        self._pending_directions.append(direction)
+        self._pending.append((msg, direction))
+        if not self._batch_timer.isActive():
+            self._batch_timer.start()
 
     def on_messages(self, messages: list[CanMessage]):
         if not self._recording:
             return
-        self._pending.extend(messages)
-        self._pending_directions.extend("Rx" for _ in messages)
+        self._pending.extend(zip(messages, repeat("Rx")))
+        if messages and not self._batch_timer.isActive():
+            self._batch_timer.start()
 
     # -- Disk file management --
 
     def _open_trace_file(self):
-        """Open a new trace file with ISO 8601 timestamp."""
+        """Start writing a new trace file named with an ISO 8601 timestamp."""
         if self._trace_folder is None:
             return
+        self._close_trace_file()
         self._trace_folder.mkdir(parents=True, exist_ok=True)
-        self._base_name = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-        self._file_index = 0
-        ext = self._trace_format.value
-        path = self._trace_folder / f"{self._base_name}.{ext}"
-        self._writer = create_trace_writer(path, self._trace_format)
-        self._writer.open()
-        self.file_changed.emit(str(path))
-
-    def _roll_trace_file(self):
-        """Close current file and open a new one with incremented index."""
-        if self._writer is not None:
-            self._writer.close()
-        self._file_index += 1
-        ext = self._trace_format.value
-        path = self._trace_folder / f"{self._base_name}_{self._file_index:03d}.{ext}"
-        self._writer = create_trace_writer(path, self._trace_format)
-        self._writer.open()
-        self.file_changed.emit(str(path))
+        base_name = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        self._disk_writer = TraceDiskWriter(
+            self._trace_folder, base_name, self._trace_format, MAX_FILE_SIZE, self)
+        self._disk_writer.file_changed.connect(self._on_file_changed)
+        self._disk_writer.error.connect(self.write_error)
+        # A running QThread must never be destroyed: stop the writer when the
+        # application quits or this model (its parent) goes away
+        self.destroyed.connect(self._disk_writer.stop)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._disk_writer.stop)
+        self._disk_writer.start()
+        self._on_file_changed(str(self._disk_writer.path))
 
     def _close_trace_file(self):
-        if self._writer is not None:
-            self._writer.close()
-            self._writer = None
-            self.file_changed.emit("")
-
-    def _write_entry_to_disk(self, entry: TraceEntry):
-        """Write a single trace entry to the current file, rolling if needed."""
-        if self._writer is None:
-            return
-        if self._writer.file_size >= MAX_FILE_SIZE:
-            self._roll_trace_file()
-        msg = CanMessage(
-            arbitration_id=entry.can_id,
-            data=entry.data,
-            is_extended_id=entry.is_extended_id,
-            is_fd=entry.frame_type == "FD",
-            dlc=entry.dlc,
-            timestamp=entry.timestamp + (self._start_time or 0),
-            bus=entry.bus,
-        )
-        self._writer.write(msg, direction=entry.direction)
+        if self._disk_writer is not None:
+            self._disk_writer.stop()
+            self._disk_writer.deleteLater()
+            self._disk_writer = None
+
+    def _on_file_changed(self, path: str):
+        self._current_file = path
+        self.file_changed.emit(path)
 
     # -- Batching / view updates --
 
@@ -208,65 +284,49 @@ class TraceModel(QAbstractTableModel):
                 parts.append(f"{sig.name}={sig.display_value}")
         return "  ".join(parts)
 
-    @staticmethod
-    def _format_display(entry: TraceEntry) -> tuple:
-        """Pre-format a TraceEntry into a tuple of display values."""
-        can_id_str = (
-            f"{entry.can_id:08X}" if entry.is_extended_id else f"{entry.can_id:03X}"
-        )
-        data_str = " ".join(f"{b:02X}" for b in entry.data)
-        return (
-            entry.number,
-            f"{entry.timestamp:.3f}",
-            entry.bus,
-            can_id_str,
-            entry.direction,
-            entry.frame_type,
-            entry.dlc,
-            data_str,
-            entry.decoded,
-        )
-
     def _flush(self):
-        """Fast timer (50ms): convert pending CAN messages to TraceEntry objects
-        and write them to disk immediately."""
+        """Fast timer (50ms after the first pending message): write pending
+        CAN messages to disk and stage their raw fields for display."""
         if not self._pending:
             return
-        batch = self._pending
-        directions = self._pending_directions
-        self._pending = []
-        self._pending_directions = []
+        batch = list(self._pending)
+        self._pending.clear()
 
         # Update rate counter
-        import time
-        now = time.monotonic()
+        now_ns = monotonic_ns()
         self._rate_count += len(batch)
-        elapsed = now - self._rate_window_start
-        if elapsed >= 1.0:
-            rate = int(self._rate_count / elapsed)
+        elapsed_ns = now_ns - self._rate_window_start_ns
+        if elapsed_ns >= 1_000_000_000:
+            rate = self._rate_count * 1_000_000_000 // elapsed_ns
             self.rate_updated.emit(rate)
             self._rate_count = 0
-            self._rate_window_start = now
-
-        for msg, direction in zip(batch, directions):
+            self._rate_window_start_ns = now_ns
+
+        # Frames without a DBC definition skip the decode call chain entirely
+        known_ids = self._decoder.known_ids if self._decoder is not None else frozenset()
+        if self._disk_writer is not None:
+            self._disk_writer.write_batch(batch)
+        # Only the newest DISPLAY_BUFFER_SIZE rows can ever be shown; older ones
+        # in a burst are numbered and written to disk but never decoded
+        display_from = len(batch) - DISPLAY_BUFFER_SIZE
+        for i, (msg, direction) in enumerate(batch):
             if self._start_time is None:
                 self._start_time = msg.timestamp
             self._msg_number += 1
-            decoded = self._decode_message(msg.arbitration_id, msg.data)
-            entry = TraceEntry(
-                number=self._msg_number,
-                timestamp=msg.timestamp - self._start_time,
-                bus=msg.bus,
-                can_id=msg.arbitration_id,
-                is_extended_id=msg.is_extended_id,
-                direction=direction,
-                frame_type=msg.frame_type,
-                dlc=msg.dlc,
-                data=msg.data,
-                decoded=decoded,
-            )
-            self._write_entry_to_disk(entry)
-            self._staged.append((entry, self._format_display(entry)))
+            if i < display_from:
+                continue
+            if msg.arbitration_id in known_ids:
+                decoded = self._decode_message(msg.arbitration_id, msg.data)
+            else:
+                decoded = ""
+            # Display text is formatted on demand in data()
+            self._staged.append((
+                self._msg_number, msg.timestamp - self._start_time, msg.bus,
+                msg.arbitration_id, msg.is_extended_id, direction,
+                msg.frame_type, msg.dlc, msg.data, decoded,
+            ))
+        if len(self._staged) > DISPLAY_BUFFER_SIZE:
+            del self._staged[:-DISPLAY_BUFFER_SIZE]
 
     def _commit_staged(self):
         """Slow timer (500ms): commit staged entries to the model for display."""
@@ -275,34 +335,28 @@ class TraceModel(QAbstractTableModel):
         staged = self._staged
         self._staged = []
 
-        new_entries = [pair[0] for pair in staged]
-        new_display = [pair[1] for pair in staged]
-
-        old_size = len(self._entries)
-        count = len(new_entries)
+        old_size = self._rows.size
+        count = len(staged)
 
         if old_size >= DISPLAY_BUFFER_SIZE:
             # Buffer already full — row count stays the same.
             # Use dataChanged instead of beginResetModel to avoid
             # tearing down all view state (selection, scroll, editors)
             # every 500ms.
-            self._entries.extend(new_entries)
-            self._display_rows.extend(new_display)
+            self._rows.extend(staged)
             self.dataChanged.emit(
                 self.index(0, 0),
-                self.index(len(self._entries) - 1, self.columnCount() - 1),
+                self.index(self._rows.size - 1, len(COLUMNS) - 1),
             )
         elif old_size + count <= DISPLAY_BUFFER_SIZE:
             # Buffer growing, won't overflow
             self.beginInsertRows(QModelIndex(), old_size, old_size + count - 1)
-            self._entries.extend(new_entries)
-            self._display_rows.extend(new_display)
+            self._rows.extend(staged)
             self.endInsertRows()
         else:
             # Transition: buffer fills mid-batch (one-time)
             self.beginResetModel()
-            self._entries.extend(new_entries)
-            self._display_rows.extend(new_display)
+            self._rows.extend(staged)
             self.endResetModel()
 
         self.entries_committed.emit()
@@ -310,7 +364,7 @@ class TraceModel(QAbstractTableModel):
     def rowCount(self, parent=QModelIndex()):
         if parent.isValid():
             return 0
-        return len(self._entries)
+        return self._rows.size
 
     def columnCount(self, parent=QModelIndex()):
         return len(COLUMNS)
@@ -324,9 +378,18 @@ class TraceModel(QAbstractTableModel):
         if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
             return None
         row = index.row()
-        if row < 0 or row >= len(self._display_rows):
+        rows = self._rows
+        if row < 0 or row >= rows.size:
             return None
-        return self._display_rows[row][index.column()]
+        slot = rows.slot(row)
+        number = rows.numbers[slot]
+        cache = self._row_cache
+        display = cache.get(number)
+        if display is None:
+            display = cache[number] = rows.display(slot)
+            if len(cache) > ROW_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        return display[index.column()]
 
     def flags(self, index: QModelIndex):
         return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
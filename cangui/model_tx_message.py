@@ -32,10 +32,48 @@ class TxMessageItem:
     trigger: str = "Time"
     creator: str = "User"
     signals: list[TxSignalItem] = field(default_factory=list)
+    # Display strings for the CAN-ID and data columns, formatted on first paint
+    _id_str: str | None = field(default=None, init=False, repr=False, compare=False)
+    _data_hex: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def invalidate_display(self):
+        """Drop cached display strings after can_id, length or raw_data change."""
+        self._id_str = None
+        self._data_hex = None
 
 
 COLUMNS = ["Bus", "CAN-ID (hex)", "Type", "Length", "Symbol",
            "Data (hex)", "Cycle Time", "Count", "Trigger", "Creator"]
+_N_COLUMNS = len(COLUMNS)
+_LAST_COLUMN = _N_COLUMNS - 1
+
+
+def _id_text(item: TxMessageItem) -> str:
+    if item._id_str is None:
+        item._id_str = (f"{item.can_id:08X}" if item.is_extended_id
+                        else f"{item.can_id:03X}")
+    return item._id_str
+
+
+def _data_text(item: TxMessageItem) -> str:
+    if item._data_hex is None:
+        item._data_hex = item.raw_data[:item.length].hex(" ").upper()
+    return item._data_hex
+
+
+# Per-column value getters (TxMessageItem -> display/edit value), indexed by column
+_DISPLAY_GETTERS = (
+    lambda i: i.bus,
+    _id_text,
+    lambda i: i.frame_type,
+    lambda i: i.length,
+    lambda i: i.symbol,
+    _data_text,
+    lambda i: i.cycle_time_ms,
+    lambda i: i.count,
+    lambda i: "Time" if i.cycle_enabled else "Wait",
+    lambda i: i.creator,
+)
 
 
 class TxMessageModel(QAbstractItemModel):
@@ -43,9 +81,12 @@ class TxMessageModel(QAbstractItemModel):
         super().__init__(parent)
         self._items: list[TxMessageItem] = []
         self._decoder: SignalDecoder | None = None
+        # Symbol names for the dropdown, built on first use
+        self._symbol_names: list[str] | None = None
 
     def set_decoder(self, decoder: SignalDecoder):
         self._decoder = decoder
+        self._symbol_names = None
 
     # -- QAbstractItemModel required overrides --
 
@@ -74,7 +115,7 @@ class TxMessageModel(QAbstractItemModel):
         return 0
 
     def columnCount(self, parent=QModelIndex()):
-        return len(COLUMNS)
+        return _N_COLUMNS
 
     def _is_top_level(self, index: QModelIndex) -> bool:
         return index.internalId() == _TOP_LEVEL
@@ -98,20 +139,7 @@ class TxMessageModel(QAbstractItemModel):
                 return Qt.CheckState.Checked if item.cycle_enabled else Qt.CheckState.Unchecked
 
             if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
-                match col:
-                    case 0: return item.bus
-                    case 1:
-                        if item.is_extended_id:
-                            return f"{item.can_id:08X}"
-                        return f"{item.can_id:03X}"
-                    case 2: return item.frame_type
-                    case 3: return item.length
-                    case 4: return item.symbol
-                    case 5: return " ".join(f"{b:02X}" for b in item.raw_data[:item.length])
-                    case 6: return item.cycle_time_ms
-                    case 7: return item.count
-                    case 8: return "Time" if item.cycle_enabled else "Wait"
-                    case 9: return item.creator
+                return _DISPLAY_GETTERS[col](item)
         else:
             # Signal child row
             parent_row = index.internalId() - 1
@@ -193,7 +221,7 @@ class TxMessageModel(QAbstractItemModel):
                             if len(item.raw_data) < length:
                                 item.raw_data.extend(b'\x00' * (length - len(item.raw_data)))
                             elif len(item.raw_data) > length:
-                                item.raw_data = item.raw_data[:length]
+                                del item.raw_data[length:]
                     except (ValueError, TypeError):
                         return False
                 case 4:
@@ -208,11 +236,12 @@ class TxMessageModel(QAbstractItemModel):
                     self._rebuild_signals(index.row())
                 case 5:
                     try:
-                        data = bytes.fromhex(str(value).replace(" ", ""))
-                        item.raw_data = bytearray(data)
-                        item.length = len(data)
+                        # fromhex skips whitespace between bytes itself
+                        data = bytes.fromhex(str(value))
                     except ValueError:
                         return False
+                    item.raw_data[:] = data
+                    item.length = len(data)
                     self._redecode_signals(index.row())
                 case 6:
                     try:
@@ -221,10 +250,12 @@ class TxMessageModel(QAbstractItemModel):
                         return False
                 case _:
                     return False
+            if col in (1, 3, 4, 5):
+                item.invalidate_display()
             # CAN-ID / Symbol change updates the whole row (symbol, length, data, cycle)
             if col in (1, 4):
                 left = self.index(index.row(), 0)
-                right = self.index(index.row(), self.columnCount() - 1)
+                right = self.index(index.row(), _LAST_COLUMN)
                 self.dataChanged.emit(left, right)
             else:
                 self.dataChanged.emit(index, index)
@@ -258,8 +289,18 @@ class TxMessageModel(QAbstractItemModel):
         sig.value = parsed
         self.dataChanged.emit(index, index)
 
-        # Re-encode all signals back into raw_data
-        self._encode_signals(parent_row)
+        # Patch just this signal's bits; fall back to re-encoding all signals
+        encoded = None
+        if self._decoder is not None:
+            encoded = self._decoder.encode_update(
+                item.can_id, bytes(item.raw_data), sig.name, parsed)
+        if encoded is None:
+            self._encode_signals(parent_row)
+        else:
+            item.raw_data[:] = encoded
+            item.invalidate_display()
+            data_idx = self.index(parent_row, 5)
+            self.dataChanged.emit(data_idx, data_idx)
         return True
 
     # -- Signal / DBC helpers --
@@ -273,6 +314,7 @@ class TxMessageModel(QAbstractItemModel):
         """
         if self._decoder is None:
             return
+        item.invalidate_display()
         sym = self._decoder.get_symbol(item.can_id)
         if sym:
             item.symbol = sym
@@ -288,7 +330,7 @@ class TxMessageModel(QAbstractItemModel):
             sigs = self._decoder.get_signals_for_id(item.can_id)
             signal_data = {s.name: s.value for s in sigs}
             encoded = self._decoder.encode(item.can_id, signal_data)
-            item.raw_data = bytearray(encoded) if encoded else bytearray(length)
+            item.raw_data[:] = encoded if encoded else bytes(length)
 
     def _rebuild_signals(self, row: int):
         """Rebuild signal children from the decoder for a given message row."""
@@ -336,9 +378,8 @@ class TxMessageModel(QAbstractItemModel):
                 sig.value = ds.value
 
         # Notify signal rows changed
-        parent_idx = self.index(row, 0)
-        first = self.index(0, 0, parent_idx)
-        last = self.index(len(item.signals) - 1, self.columnCount() - 1, parent_idx)
+        first = self.createIndex(0, 0, row + 1)
+        last = self.createIndex(len(item.signals) - 1, _LAST_COLUMN, row + 1)
         self.dataChanged.emit(first, last)
 
     def _encode_signals(self, row: int):
@@ -349,11 +390,12 @@ class TxMessageModel(QAbstractItemModel):
         signal_data = {sig.name: sig.value for sig in item.signals}
         encoded = self._decoder.encode(item.can_id, signal_data)
         if encoded is not None:
-            item.raw_data = bytearray(encoded)
+            item.raw_data[:] = encoded
             item.length = len(item.raw_data)
+            item.invalidate_display()
             # Notify parent row data changed (raw_data column)
-            top_left = self.index(row, 0)
-            bottom_right = self.index(row, self.columnCount() - 1)
+            top_left = self.createIndex(row, 0, _TOP_LEVEL)
+            bottom_right = self.createIndex(row, _LAST_COLUMN, _TOP_LEVEL)
             self.dataChanged.emit(top_left, bottom_right)
 
     # -- Public API --
@@ -380,6 +422,7 @@ class TxMessageModel(QAbstractItemModel):
     def clear(self):
         self.beginResetModel()
         self._items.clear()
+        self._symbol_names = None
         self.endResetModel()
 
     def remove_message(self, row: int):
@@ -417,7 +460,9 @@ class TxMessageModel(QAbstractItemModel):
         """Return all DBC symbol names for the dropdown."""
         if self._decoder is None:
             return []
-        return [name for name, _ in self._decoder.get_all_symbols()]
+        if self._symbol_names is None:
+            self._symbol_names = [name for name, _ in self._decoder.get_all_symbols()]
+        return self._symbol_names
 
     @property
     def items(self) -> list[TxMessageItem]:
@@ -429,15 +474,16 @@ class TxMessageModel(QAbstractItemModel):
             item.count = 0
         if self._items:
             self.dataChanged.emit(
-                self.index(0, 7),
-                self.index(len(self._items) - 1, 7),
+                self.createIndex(0, 7, _TOP_LEVEL),
+                self.createIndex(len(self._items) - 1, 7, _TOP_LEVEL),
+                [Qt.ItemDataRole.DisplayRole],
             )
 
     def increment_count(self, row: int):
         if 0 <= row < len(self._items):
             self._items[row].count += 1
-            idx = self.index(row, 7)  # Count column
-            self.dataChanged.emit(idx, idx)
+            idx = self.createIndex(row, 7, _TOP_LEVEL)  # Count column
+            self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole])
 
     def increment_counts(self, counts: dict[int, int]):
         """Apply batched count deltas: {row: delta}."""
@@ -452,17 +498,19 @@ class TxMessageModel(QAbstractItemModel):
                     max_row = row
         if min_row is not None:
             self.dataChanged.emit(
-                self.index(min_row, 7),
-                self.index(max_row, 7),
+                self.createIndex(min_row, 7, _TOP_LEVEL),
+                self.createIndex(max_row, 7, _TOP_LEVEL),
+                [Qt.ItemDataRole.DisplayRole],
             )
 
     def refresh_signals(self):
         """Re-resolve symbols and rebuild signals after DBC load/remove."""
+        self._symbol_names = None
         for row, item in enumerate(self._items):
             self._resolve_from_db(item, override=False)
             self._rebuild_signals(row)
         if self._items:
             self.dataChanged.emit(
-                self.index(0, 0),
-                self.index(len(self._items) - 1, self.columnCount() - 1),
+                self.createIndex(0, 0, _TOP_LEVEL),
+                self.createIndex(len(self._items) - 1, _LAST_COLUMN, _TOP_LEVEL),
             )
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
@@ -21,6 +22,7 @@ class WatchEntry:
 
 
 COLUMNS = ["Name", "Value", "Direction"]
+_N_COLUMNS = len(COLUMNS)
 
 
 class WatchModel(QAbstractTableModel):
@@ -28,17 +30,40 @@ class WatchModel(QAbstractTableModel):
         super().__init__(parent)
         self._entries: list[WatchEntry] = []
         self._decoder = decoder
-        # Index for fast lookup: arb_id -> list of entry indices
-        self._arb_id_to_entries: dict[int, list[int]] = {}
-        self._pending: list[CanMessage] = []
-
+        # arb_id -> watched signal names of that ID
+        self._signals_by_id: dict[int, set[str]] = {}
+        # Watched arbitration IDs, the enqueue-time filter
+        self._watched_ids: frozenset[int] = frozenset()
+        # (arb_id, signal_name) -> entry index; add_watch keeps pairs unique
+        self._lookup: dict[tuple[int, str], int] = {}
+        # arb_id -> decoder compiled for just the watched signals of that ID
+        self._decoders: dict[int, Callable[[bytes], list[tuple[str, str, str]]]] = {}
+        # Latest pending message per watched arb_id (newest value wins)
+        self._pending: dict[int, CanMessage] = {}
+
+        # Single-shot, armed by the first watched message after a flush
         self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
         self._batch_timer.setInterval(100)
         self._batch_timer.timeout.connect(self._flush)
-        self._batch_timer.start()
 
     def set_decoder(self, decoder: SignalDecoder):
         self._decoder = decoder
+        self.refresh_decoders()
+
+    def refresh_decoders(self):
+        """Recompile per-ID decoders (call after databases are loaded or removed)."""
+        self._decoders.clear()
+        for arb_id in self._signals_by_id:
+            self._compile_decoder(arb_id)
+
+    def _compile_decoder(self, arb_id: int):
+        self._decoders.pop(arb_id, None)
+        if self._decoder is None:
+            return
+        fn = self._decoder.compile(arb_id, self._signals_by_id[arb_id])
+        if fn is not None:
+            self._decoders[arb_id] = fn
 
     def rowCount(self, parent=QModelIndex()):
         if parent.isValid():
@@ -46,7 +71,7 @@ class WatchModel(QAbstractTableModel):
         return len(self._entries)
 
     def columnCount(self, parent=QModelIndex()):
-        return len(COLUMNS)
+        return _N_COLUMNS
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
@@ -71,10 +96,9 @@ class WatchModel(QAbstractTableModel):
 
     def add_watch(self, arb_id: int, signal_name: str, display_name: str = "",
                   unit: str = "", direction: str = "Rx"):
-        # Check for duplicates
-        for e in self._entries:
-            if e.arb_id == arb_id and e.signal_name == signal_name:
-                return
+        key = (arb_id, signal_name)
+        if key in self._lookup:
+            return
         row = len(self._entries)
         self.beginInsertRows(QModelIndex(), row, row)
         self._entries.append(WatchEntry(
@@ -84,72 +108,93 @@ class WatchModel(QAbstractTableModel):
             unit=unit,
             direction=direction,
         ))
-        self._rebuild_index()
+        self._lookup[key] = row
+        names = self._signals_by_id.get(arb_id)
+        if names is None:
+            names = self._signals_by_id[arb_id] = set()
+            self._watched_ids = self._watched_ids | {arb_id}
+        names.add(signal_name)
+        self._compile_decoder(arb_id)
         self.endInsertRows()
 
     def remove_watch(self, row: int):
         if 0 <= row < len(self._entries):
             self.beginRemoveRows(QModelIndex(), row, row)
-            self._entries.pop(row)
-            self._rebuild_index()
+            entry = self._entries.pop(row)
+            lookup = self._lookup
+            del lookup[(entry.arb_id, entry.signal_name)]
+            for key, idx in lookup.items():
+                if idx > row:
+                    lookup[key] = idx - 1
+            names = self._signals_by_id[entry.arb_id]
+            names.discard(entry.signal_name)
+            if names:
+                self._compile_decoder(entry.arb_id)
+            else:
+                del self._signals_by_id[entry.arb_id]
+                self._decoders.pop(entry.arb_id, None)
+                self._watched_ids = frozenset(self._signals_by_id)
             self.endRemoveRows()
 
     def on_message(self, msg: CanMessage):
         """Queue a single message for processing."""
-        if msg.arbitration_id in self._arb_id_to_entries:
-            self._pending.append(msg)
+        if msg.arbitration_id in self._watched_ids:
+            self._pending[msg.arbitration_id] = msg
+            if not self._batch_timer.isActive():
+                self._batch_timer.start()
 
     def on_messages(self, messages: list[CanMessage]):
         """Queue a batch of messages for processing."""
-        index = self._arb_id_to_entries
+        watched = self._watched_ids
+        if not watched:
+            return
+        pending = self._pending
         for msg in messages:
-            if msg.arbitration_id in index:
-                self._pending.append(msg)
+            if msg.arbitration_id in watched:
+                pending[msg.arbitration_id] = msg
+        if pending and not self._batch_timer.isActive():
+            self._batch_timer.start()
 
     def _flush(self):
         """Process pending messages and update watched signal values."""
-        if not self._pending or self._decoder is None:
+        if not self._pending:
             return
         batch = self._pending
-        self._pending = []
-
-        # Keep only the last message per arb_id (latest value wins)
-        latest: dict[int, CanMessage] = {}
-        for msg in batch:
-            latest[msg.arbitration_id] = msg
+        self._pending = {}
 
         changed_indices: set[int] = set()
-        for arb_id, msg in latest.items():
-            entries = self._arb_id_to_entries.get(arb_id)
-            if not entries:
-                continue
-            decoded = self._decoder.decode(arb_id, msg.data)
-            if not decoded:
+        lookup = self._lookup
+        decoders = self._decoders
+        for arb_id, msg in batch.items():
+            decode_fn = decoders.get(arb_id)
+            if decode_fn is None:
                 continue
-            for idx in entries:
+            for name, new_val, unit in decode_fn(msg.data):
+                idx = lookup[(arb_id, name)]
                 entry = self._entries[idx]
-                for ds in decoded:
-                    if ds.name == entry.signal_name:
-                        new_val = ds.display_value
-                        if entry.value != new_val:
-                            entry.value = new_val
-                            if not entry.unit and ds.unit:
-                                entry.unit = ds.unit
-                            changed_indices.add(idx)
-                        break
+                if entry.value != new_val:
+                    entry.value = new_val
+                    if not entry.unit and unit:
+                        entry.unit = unit
+                    changed_indices.add(idx)
 
         if changed_indices:
-            min_idx = min(changed_indices)
-            max_idx = max(changed_indices)
-            self.dataChanged.emit(
-                self.index(min_idx, 1),
-                self.index(max_idx, 1),
-            )
-
-    def _rebuild_index(self):
-        self._arb_id_to_entries.clear()
-        for i, entry in enumerate(self._entries):
-            self._arb_id_to_entries.setdefault(entry.arb_id, []).append(i)
+            # One signal per contiguous run of rows, so untouched rows in
+            # between are not repainted
+            roles = [Qt.ItemDataRole.DisplayRole]
+            rows = sorted(changed_indices)
+            start = prev = rows[0]
+            for row in rows[1:]:
+                if row != prev + 1:
+                    self.dataChanged.emit(self.index(start, 1), self.index(prev, 1), roles)
+                    start = row
+                prev = row
+            self.dataChanged.emit(self.index(start, 1), self.index(prev, 1), roles)
+
+    @property
+    def watched_arbitration_ids(self) -> frozenset[int]:
+        """Arbitration IDs with at least one watched signal, for filtering at the source."""
+        return self._watched_ids
 
     @property
     def entries(self) -> list[WatchEntry]:
@@ -158,6 +203,9 @@ class WatchModel(QAbstractTableModel):
     def clear(self):
         self.beginResetModel()
         self._entries.clear()
-        self._arb_id_to_entries.clear()
+        self._signals_by_id.clear()
+        self._watched_ids = frozenset()
+        self._lookup.clear()
+        self._decoders.clear()
         self._pending.clear()
         self.endResetModel()
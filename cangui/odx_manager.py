@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import odxtools
+if TYPE_CHECKING:
+    import odxtools
 
 
 @dataclass
@@ -26,19 +29,22 @@ class OdxVariant:
     long_name: str = ""
     dids: list[OdxDid] = field(default_factory=list)
     services: list[OdxService] = field(default_factory=list)
+    # IDs already in dids, for the duplicate check while extracting
+    _did_ids: set[int] = field(default_factory=set, repr=False, compare=False)
 
 
 class OdxManager:
     """Manages ODX/PDX diagnostic database files using odxtools."""
 
     def __init__(self):
-        self._databases: list[odxtools.database.Database] = []
-        self._files: list[Path] = []
+        self._databases: "dict[Path, odxtools.database.Database]" = {}
+        # Variants extracted per file so removing a file never re-extracts the rest
+        self._file_variants: dict[Path, list[OdxVariant]] = {}
         self._variants: list[OdxVariant] = []
 
     @property
     def files(self) -> list[Path]:
-        return list(self._files)
+        return list(self._databases)
 
     @property
     def variants(self) -> list[OdxVariant]:
@@ -47,68 +53,72 @@ class OdxManager:
     def load_file(self, path: str | Path) -> list[str]:
         """Load an ODX/PDX file. Returns list of variant short names."""
         path = Path(path)
-        if path in self._files:
+        if path in self._databases:
             return []
+        import odxtools
         db = odxtools.load_file(path)
-        self._databases.append(db)
-        self._files.append(path)
-        names = self._extract_variants(db)
-        return names
-
-    def _extract_variants(self, db: odxtools.database.Database) -> list[str]:
-        names = []
+        self._databases[path] = db
+        variants = self._extract_variants(db)
+        self._file_variants[path] = variants
+        self._variants.extend(variants)
+        return [v.short_name for v in variants]
+
+    def _extract_variants(self, db: "odxtools.database.Database") -> list[OdxVariant]:
+        variants = []
         for dl in db.diag_layers:
-            variant = OdxVariant(
-                short_name=dl.short_name,
-                long_name=getattr(dl, "long_name", "") or "",
-            )
+            try:
+                long_name = dl.long_name or ""
+            except AttributeError:
+                long_name = ""
+            variant = OdxVariant(short_name=dl.short_name, long_name=long_name)
             # Extract DIDs from diag services
             try:
                 for service in dl.services:
-                    odx_svc = OdxService(
-                        short_name=service.short_name,
-                        long_name=getattr(service, "long_name", "") or "",
-                    )
-                    # Try to get service ID from request
-                    if hasattr(service, "request") and service.request is not None:
-                        req = service.request
-                        if hasattr(req, "coded_const_prefix"):
-                            prefix = req.coded_const_prefix()
-                            if prefix:
-                                odx_svc.service_id = prefix[0]
+                    try:
+                        long_name = service.long_name or ""
+                    except AttributeError:
+                        long_name = ""
+                    odx_svc = OdxService(short_name=service.short_name, long_name=long_name)
+                    # Service ID from the request's constant prefix, computed
+                    # once and shared with the DID extraction
+                    prefix = self._request_prefix(service)
+                    if prefix:
+                        odx_svc.service_id = prefix[0]
                     variant.services.append(odx_svc)
 
                     # Extract DID info from ReadDataByIdentifier services
-                    self._extract_dids_from_service(service, variant)
+                    if prefix:
+                        self._extract_did(prefix, odx_svc, variant)
             except Exception:
                 pass
 
-            self._variants.append(variant)
-            names.append(variant.short_name)
-        return names
+            variants.append(variant)
+        return variants
 
-    def _extract_dids_from_service(self, service, variant: OdxVariant):
-        """Try to extract DID definitions from a service."""
+    @staticmethod
+    def _request_prefix(service) -> bytes | None:
+        req = getattr(service, "request", None)
+        if req is None or not hasattr(req, "coded_const_prefix"):
+            return None
         try:
-            if not hasattr(service, "request") or service.request is None:
-                return
-            req = service.request
-            prefix = req.coded_const_prefix()
-            if not prefix or prefix[0] != 0x22:
-                return
-            # This is a ReadDataByIdentifier — try to get the DID
-            if len(prefix) >= 3:
-                did_id = (prefix[1] << 8) | prefix[2]
-                did = OdxDid(
-                    did_id=did_id,
-                    name=service.short_name,
-                    description=getattr(service, "long_name", "") or "",
-                )
-                # Avoid duplicates
-                if not any(d.did_id == did_id for d in variant.dids):
-                    variant.dids.append(did)
+            return req.coded_const_prefix()
         except Exception:
-            pass
+            return None
+
+    @staticmethod
+    def _extract_did(prefix: bytes, service: OdxService, variant: OdxVariant):
+        """Add the DID read by a ReadDataByIdentifier request prefix."""
+        if prefix[0] != 0x22 or len(prefix) < 3:
+            return
+        did_id = (prefix[1] << 8) | prefix[2]
+        # Avoid duplicates
+        if did_id not in variant._did_ids:
+            variant._did_ids.add(did_id)
+            variant.dids.append(OdxDid(
+                did_id=did_id,
+                name=service.short_name,
+                description=service.long_name,
+            ))
 
     def get_all_dids(self) -> list[OdxDid]:
         """Get all DIDs across all loaded variants."""
@@ -119,22 +129,17 @@ class OdxManager:
                 if d.did_id not in seen:
                     seen.add(d.did_id)
                     result.append(d)
-        result.sort(key=lambda d: d.did_id)
+        result.sort(key=attrgetter("did_id"))
         return result
 
     def remove_file(self, path: str | Path):
         path = Path(path)
-        if path not in self._files:
+        if self._databases.pop(path, None) is None:
             return
-        idx = self._files.index(path)
-        self._files.pop(idx)
-        self._databases.pop(idx)
-        # Rebuild variants
-        self._variants.clear()
-        for db in self._databases:
-            self._extract_variants(db)
+        del self._file_variants[path]
+        self._variants = [v for variants in self._file_variants.values() for v in variants]
 
     def clear(self):
         self._databases.clear()
-        self._files.clear()
+        self._file_variants.clear()
         self._variants.clear()
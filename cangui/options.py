@@ -1,9 +1,13 @@
-import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
+from cangui.json_io import dump_json, load_json
 
+
+@cache
 def _config_path() -> Path:
+    """Return the options file path, creating its directory on first use."""
     p = Path.home() / ".config" / "cangui"
     p.mkdir(parents=True, exist_ok=True)
     return p / "options.json"
@@ -50,8 +54,7 @@ class AppOptions:
     plot: PlotOptions = field(default_factory=PlotOptions)
 
     def save(self):
-        with open(_config_path(), "w") as f:
-            json.dump(asdict(self), f, indent=2)
+        dump_json(_config_path(), self)
 
     @classmethod
     def load(cls) -> "AppOptions":
@@ -59,8 +62,7 @@ class AppOptions:
         if not path.exists():
             return cls()
         try:
-            with open(path) as f:
-                data = json.load(f)
+            data = load_json(path)
             return cls(
                 general=GeneralOptions(**data.get("general", {})),
                 rx_tx=RxTxOptions(**data.get("rx_tx", {})),
@@ -1,7 +1,8 @@
-import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
+from cangui.json_io import dump_json, load_json
+
 
 @dataclass
 class ProjectData:
@@ -84,14 +85,13 @@ class Project:
         if self._path is None:
             raise ValueError("No path specified")
         self._data.name = self._path.stem
-        with open(self._path, "w") as f:
-            json.dump(asdict(self._data), f, indent=2)
+        # Shallow mapping: all fields are JSON-native, asdict() would deep-copy them
+        dump_json(self._path, {f.name: getattr(self._data, f.name) for f in fields(self._data)})
         self._modified = False
 
     def load(self, path: str | Path):
         self._path = Path(path)
-        with open(self._path) as f:
-            raw = json.load(f)
+        raw = load_json(self._path)
         self._data = ProjectData(
             name=self._path.stem,
             database_files=raw.get("database_files", []),
@@ -3,11 +3,20 @@ from dataclasses import dataclass, field
 import numpy as np
 from PySide6.QtCore import QObject, QTimer, Signal
 
+try:
+    from numba import njit
+except ImportError:  # optional; fall back to the NumPy implementation
+    njit = None
+
 from cangui.can_message import CanMessage
 from cangui.signal_decoder import SignalDecoder
 
 
 MAX_DISPLAY_POINTS = 5000
+BUFFER_INITIAL_CAPACITY = 1024
+# Buffers longer than this many times the display points are MinMax-reduced
+# to that many points before LTTB (MinMaxLTTB)
+MINMAX_RATIO = 4
 
 
 def lttb_downsample(x: np.ndarray, y: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
@@ -29,28 +38,84 @@ def lttb_downsample(x: np.ndarray, y: np.ndarray, n: int) -> tuple[np.ndarray, n
     out_y[n - 1] = y[-1]
 
     bucket_size = (length - 2) / (n - 2)
+    if _lttb_kernel is not None:
+        _lttb_kernel(x, y, out_x, out_y, n, bucket_size)
+        return out_x, out_y
+
+    # edges[k] is where bucket k starts; bucket i (1..n-2) spans
+    # [edges[i-1], edges[i]) and is compared against the mean of bucket i+1
+    edges = np.minimum((np.arange(n) * bucket_size).astype(np.int64) + 1, length)
+    next_starts = edges[1:n - 1]
+    counts = np.diff(edges[1:])
+    avg_xs = np.add.reduceat(x[:edges[-1]], next_starts) / counts
+    avg_ys = np.add.reduceat(y[:edges[-1]], next_starts) / counts
 
     a_idx = 0
     for i in range(1, n - 1):
-        # Calculate bucket range
-        start = int((i - 1) * bucket_size) + 1
-        end = int(i * bucket_size) + 1
-        end = min(end, length)
+        start = edges[i - 1]
+        end = edges[i]
+        ax = x[a_idx]
+        ay = y[a_idx]
+        # Point in this bucket forming the largest triangle with the previous
+        # pick and the next bucket's mean
+        areas = np.abs((ax - avg_xs[i - 1]) * (y[start:end] - ay)
+                       - (ax - x[start:end]) * (avg_ys[i - 1] - ay))
+        max_idx = start + int(areas.argmax())
+        out_x[i] = x[max_idx]
+        out_y[i] = y[max_idx]
+        a_idx = max_idx
 
-        # Next bucket average (for triangle area calculation)
-        next_start = int(i * bucket_size) + 1
-        next_end = int((i + 1) * bucket_size) + 1
-        next_end = min(next_end, length)
+    return out_x, out_y
 
-        avg_x = np.mean(x[next_start:next_end])
-        avg_y = np.mean(y[next_start:next_end])
 
-        # Find point with max triangle area
-        max_area = -1.0
-        max_idx = start
+def _empty_samples() -> np.ndarray:
+    return np.empty(BUFFER_INITIAL_CAPACITY, dtype=np.float64)
+
+
+def minmax_reduce(x: np.ndarray, y: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce data to about n points by keeping the minimum and maximum
+    sample of n // 2 equal-count buckets, plus the first and last sample."""
+    length = len(x)
+    n_buckets = n // 2
+    if length <= n or n_buckets < 1:
+        return x, y
+    size = length // n_buckets
+    full = n_buckets * size
+    offsets = np.arange(0, full, size)
+    buckets = y[:full].reshape(n_buckets, size)
+    parts = [np.zeros(1, dtype=np.int64),
+             offsets + buckets.argmin(axis=1), offsets + buckets.argmax(axis=1),
+             np.array([length - 1], dtype=np.int64)]
+    if full < length:
+        # Leftover samples form one short bucket
+        tail = y[full:]
+        parts.append(np.array([full + tail.argmin(), full + tail.argmax()], dtype=np.int64))
+    idx = np.unique(np.concatenate(parts))
+    return x[idx], y[idx]
+
+
+def _lttb_loop(x, y, out_x, out_y, n, bucket_size):
+    """Scalar LTTB over buckets 1..n-2, compiled with Numba when available."""
+    length = len(x)
+    a_idx = 0
+    for i in range(1, n - 1):
+        start = int((i - 1) * bucket_size) + 1
+        end = min(int(i * bucket_size) + 1, length)
+        next_start = end
+        next_end = min(int((i + 1) * bucket_size) + 1, length)
+
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(next_start, next_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        avg_x /= next_end - next_start
+        avg_y /= next_end - next_start
+
         ax = x[a_idx]
         ay = y[a_idx]
-
+        max_area = -1.0
+        max_idx = start
         for j in range(start, end):
             area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
             if area > max_area:
@@ -61,33 +126,96 @@ def lttb_downsample(x: np.ndarray, y: np.ndarray, n: int) -> tuple[np.ndarray, n
         out_y[i] = y[max_idx]
         a_idx = max_idx
 
-    return out_x, out_y
+
+_lttb_kernel = njit(cache=True)(_lttb_loop) if njit is not None else None
 
 
 @dataclass
-class SignalBuffer:
+class ArbIdBuffer:
+    """Rolling samples of the plotted signals of one arbitration ID.
+
+    Columnar: one row per decoded frame, with a shared time column and one
+    value column per signal (NaN where a value is not numeric). Rows are
+    written into preallocated arrays that double in size when full, so
+    append is amortised O(1). Trimming only advances the start offset; the
+    kept rows are copied to the front of new arrays when the arrays run out
+    of room, so views returned earlier never change.
+    """
     arb_id: int
-    signal_name: str
-    unit: str
-    times: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
-    values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    units: dict[str, str] = field(default_factory=dict)
+    _times: np.ndarray = field(default_factory=_empty_samples, init=False, repr=False)
+    _columns: dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+    _start: int = field(default=0, init=False, repr=False)
+    _end: int = field(default=0, init=False, repr=False)
 
-    def append(self, t: float, value: float):
-        self.times = np.append(self.times, t)
-        self.values = np.append(self.values, value)
+    @property
+    def times(self) -> np.ndarray:
+        """Row times, oldest first (a view into the buffer)."""
+        return self._times[self._start:self._end]
+
+    def values(self, signal_name: str) -> np.ndarray:
+        """Values of one signal matching times (a view into the buffer)."""
+        return self._columns[signal_name][self._start:self._end]
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def add_signal(self, signal_name: str, unit: str = ""):
+        self.units[signal_name] = unit
+        # Rows recorded before the signal was added have no value for it
+        self._columns[signal_name] = np.full(len(self._times), np.nan)
+
+    def remove_signal(self, signal_name: str):
+        self.units.pop(signal_name, None)
+        self._columns.pop(signal_name, None)
+
+    def append(self, t: float, values: dict[str, object]):
+        """Add a row from a decoded signal name -> value mapping."""
+        end = self._end
+        if end == len(self._times):
+            self._make_room()
+            end = self._end
+        self._times[end] = t
+        for name, column in self._columns.items():
+            try:
+                column[end] = values[name]
+            except (KeyError, TypeError, ValueError):
+                column[end] = np.nan
+        self._end = end + 1
+
+    def _make_room(self):
+        """Copy the kept rows to the front of new arrays, doubling their size
+        if they are more than half full.
+
+        Written rows are never overwritten in place: get_display_data hands
+        out views that plot items keep until they repaint.
+        """
+        start, end = self._start, self._end
+        n = end - start
+        cap = len(self._times)
+        if 2 * n > cap:
+            cap *= 2
+        times = np.empty(cap, dtype=np.float64)
+        times[:n] = self._times[start:end]
+        self._times = times
+        for name, column in self._columns.items():
+            moved = np.empty(cap, dtype=np.float64)
+            moved[:n] = column[start:end]
+            self._columns[name] = moved
+        self._start, self._end = 0, n
 
     def trim(self, max_age: float):
-        """Remove samples older than max_age seconds from the latest."""
-        if len(self.times) == 0:
+        """Remove rows older than max_age seconds from the latest."""
+        if self._end == self._start:
             return
-        cutoff = self.times[-1] - max_age
-        mask = self.times >= cutoff
-        self.times = self.times[mask]
-        self.values = self.values[mask]
+        cutoff = self._times[self._end - 1] - max_age
+        self._start += int(np.searchsorted(self._times[self._start:self._end], cutoff))
 
     def clear(self):
-        self.times = np.empty(0, dtype=np.float64)
-        self.values = np.empty(0, dtype=np.float64)
+        # Fresh arrays, for the same reason as in _make_room
+        self._times = _empty_samples()
+        self._columns = {name: np.full(len(self._times), np.nan) for name in self._columns}
+        self._start = self._end = 0
 
 
 class PlotDataService(QObject):
@@ -98,7 +226,7 @@ class PlotDataService(QObject):
     def __init__(self, decoder: SignalDecoder, parent=None):
         super().__init__(parent)
         self._decoder = decoder
-        self._buffers: dict[tuple[int, str], SignalBuffer] = {}
+        self._buffers: dict[int, ArbIdBuffer] = {}
         self._time_window = 10.0  # seconds
         self._max_display_points = MAX_DISPLAY_POINTS
         self._start_time: float | None = None
@@ -126,42 +254,61 @@ class PlotDataService(QObject):
         self._max_display_points = max(100, value)
 
     @property
-    def buffers(self) -> dict[tuple[int, str], SignalBuffer]:
+    def buffers(self) -> dict[int, ArbIdBuffer]:
         return self._buffers
 
     def add_signal(self, arb_id: int, signal_name: str, unit: str = ""):
-        key = (arb_id, signal_name)
-        if key not in self._buffers:
-            self._buffers[key] = SignalBuffer(arb_id=arb_id, signal_name=signal_name, unit=unit)
+        buf = self._buffers.get(arb_id)
+        if buf is None:
+            buf = self._buffers[arb_id] = ArbIdBuffer(arb_id)
+        if signal_name not in buf.units:
+            buf.add_signal(signal_name, unit)
 
     def remove_signal(self, arb_id: int, signal_name: str):
-        key = (arb_id, signal_name)
-        self._buffers.pop(key, None)
+        buf = self._buffers.get(arb_id)
+        if buf is None:
+            return
+        buf.remove_signal(signal_name)
+        if not buf.units:
+            del self._buffers[arb_id]
 
     def has_signal(self, arb_id: int, signal_name: str) -> bool:
-        return (arb_id, signal_name) in self._buffers
+        buf = self._buffers.get(arb_id)
+        return buf is not None and signal_name in buf.units
 
     def get_display_data(self, key: tuple[int, str]) -> tuple[np.ndarray, np.ndarray] | None:
         """Return downsampled data suitable for display."""
-        buf = self._buffers.get(key)
-        if buf is None or len(buf.times) == 0:
+        arb_id, signal_name = key
+        buf = self._buffers.get(arb_id)
+        if buf is None or signal_name not in buf.units or len(buf) == 0:
             return None
-        if len(buf.times) <= self._max_display_points:
-            return buf.times, buf.values
-        return lttb_downsample(buf.times, buf.values, self._max_display_points)
+        times, values = buf.times, buf.values(signal_name)
+        # Rows where this signal had no numeric value are not plotted
+        valid = ~np.isnan(values)
+        if not valid.all():
+            times, values = times[valid], values[valid]
+            if len(times) == 0:
+                return None
+        n = self._max_display_points
+        if len(times) <= n:
+            return times, values
+        if len(times) > MINMAX_RATIO * n:
+            # MinMaxLTTB: cheap O(N) pre-reduction, then LTTB on the survivors
+            times, values = minmax_reduce(times, values, MINMAX_RATIO * n)
+        return lttb_downsample(times, values, n)
 
     def on_message(self, msg: CanMessage):
         """Queue a single message for processing."""
-        if any(k[0] == msg.arbitration_id for k in self._buffers):
+        if msg.arbitration_id in self._buffers:
             self._pending.append(msg)
 
     def on_messages(self, messages: list[CanMessage]):
         """Queue a batch of messages for processing."""
-        watched_ids = {k[0] for k in self._buffers}
-        if not watched_ids:
+        buffers = self._buffers
+        if not buffers:
             return
         for msg in messages:
-            if msg.arbitration_id in watched_ids:
+            if msg.arbitration_id in buffers:
                 self._pending.append(msg)
 
     def _flush(self):
@@ -171,30 +318,35 @@ class PlotDataService(QObject):
         batch = self._pending
         self._pending = []
 
+        # Group by ID so each message definition is resolved once per flush
+        groups: dict[int, list[CanMessage]] = {}
         for msg in batch:
-            decoded = self._decoder.decode(msg.arbitration_id, msg.data)
-            if not decoded:
-                continue
+            groups.setdefault(msg.arbitration_id, []).append(msg)
 
-            if self._start_time is None:
-                self._start_time = msg.timestamp
+        rows: list[tuple[ArbIdBuffer, list[tuple[float, dict[str, object]]]]] = []
+        for arb_id, msgs in groups.items():
+            buf = self._buffers.get(arb_id)
+            if buf is None:
+                continue
+            decoded = self._decoder.decode_many(arb_id, [m.data for m in msgs])
+            buf_rows = [(m.timestamp, values) for m, values in zip(msgs, decoded) if values]
+            if buf_rows:
+                rows.append((buf, buf_rows))
 
-            t = msg.timestamp - self._start_time
+        if not rows:
+            # Nothing decoded: buffers are unchanged, so skip trim and redraw
+            return
+        if self._start_time is None:
+            self._start_time = min(buf_rows[0][0] for _, buf_rows in rows)
 
-            for ds in decoded:
-                key = (msg.arbitration_id, ds.name)
-                buf = self._buffers.get(key)
-                if buf is None:
-                    continue
-                try:
-                    value = float(ds.value)
-                except (TypeError, ValueError):
-                    continue
-                buf.append(t, value)
+        start_time = self._start_time
+        for buf, buf_rows in rows:
+            for timestamp, values in buf_rows:
+                buf.append(timestamp - start_time, values)
 
         # Trim all active buffers once per flush
         for buf in self._buffers.values():
-            if len(buf.times) > 0:
+            if len(buf):
                 buf.trim(self._time_window)
 
         self.data_updated.emit()
@@ -208,4 +360,5 @@ class PlotDataService(QObject):
     @property
     def signal_list(self) -> list[tuple[int, str, str]]:
         """Return list of (arb_id, signal_name, unit) for all watched signals."""
-        return [(b.arb_id, b.signal_name, b.unit) for b in self._buffers.values()]
+        return [(b.arb_id, name, unit)
+                for b in self._buffers.values() for name, unit in b.units.items()]
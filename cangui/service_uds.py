@@ -1,9 +1,13 @@
-import can
-from PySide6.QtCore import QObject, Signal
+from typing import TYPE_CHECKING
 
-from cangui.uds_client import UdsClient, UdsConfig, UdsResponse
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from cangui.uds_client import UdsClient, UdsConfig, UdsResponse, shutdown_pool
 from cangui.worker_uds import UdsWorker, UdsRequest, UdsRequestType
 
+if TYPE_CHECKING:
+    import can
+
 
 class UdsService(QObject):
     """Bridge between UI and UDS worker for asynchronous diagnostic requests."""
@@ -18,6 +22,9 @@ class UdsService(QObject):
         self._worker = UdsWorker(self._client, self)
         self._worker.response_received.connect(self.response_received)
         self._worker.error_occurred.connect(self.error_occurred)
+        # Non-default sessions time out without periodic TesterPresent
+        self._keepalive = QTimer(self)
+        self._keepalive.timeout.connect(self._send_keepalive)
 
     @property
     def is_connected(self) -> bool:
@@ -27,19 +34,29 @@ class UdsService(QObject):
     def config(self) -> UdsConfig:
         return self._client.config
 
-    def connect(self, bus: can.BusABC, config: UdsConfig | None = None):
+    def connect(self, bus: "can.BusABC", config: UdsConfig | None = None):
         self._client.open(bus, config)
         self.connection_changed.emit(True)
 
     def disconnect(self):
+        self._keepalive.stop()
         self._worker.stop()
         self._client.close()
         self.connection_changed.emit(False)
 
+    def shutdown(self):
+        """Disconnect and release all pooled ISO-TP stacks."""
+        self.disconnect()
+        shutdown_pool()
+
     def change_session(self, session: int):
         self._worker.execute(UdsRequest(
             request_type=UdsRequestType.CHANGE_SESSION, session=session
         ))
+        if session == 0x01:
+            self._keepalive.stop()
+        else:
+            self._keepalive.start(int(self._client.config.timeout * 1000) // 2)
 
     def ecu_reset(self, reset_type: int = 0x01):
         self._worker.execute(UdsRequest(
@@ -68,6 +85,14 @@ class UdsService(QObject):
             request_type=UdsRequestType.TESTER_PRESENT
         ))
 
+    def _send_keepalive(self):
+        if not self._client.is_open:
+            self._keepalive.stop()
+            return
+        self._worker.execute(UdsRequest(
+            request_type=UdsRequestType.TESTER_PRESENT, suppress_response=True
+        ))
+
     def raw_request(self, data: bytes):
         self._worker.execute(UdsRequest(
             request_type=UdsRequestType.RAW_REQUEST, data=data
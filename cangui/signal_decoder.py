@@ -1,3 +1,4 @@
+from collections.abc import Callable, Collection
 from dataclasses import dataclass
 
 from cangui.database_manager import DatabaseManager
@@ -11,9 +12,13 @@ class DecodedSignal:
 
     @property
     def display_value(self) -> str:
-        if isinstance(self.value, float):
-            return f"{self.value:.3f}"
-        return str(self.value)
+        return _display(self.value)
+
+
+def _display(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
 
 
 class SignalDecoder:
@@ -22,17 +27,81 @@ class SignalDecoder:
     def __init__(self, db_manager: DatabaseManager):
         self._db = db_manager
 
+    @property
+    def known_ids(self) -> frozenset[int]:
+        """Arbitration IDs that have a message definition."""
+        return self._db.known_ids
+
     def decode(self, arb_id: int, data: bytes) -> list[DecodedSignal]:
         """Decode a CAN message into its constituent signals."""
         decoded = self._db.decode(arb_id, data)
         if decoded is None:
             return []
+        return self._to_signals(arb_id, decoded)
+
+    def decode_many(self, arb_id: int, payloads: list[bytes]) -> list[dict[str, object] | None]:
+        """Decode several payloads of one message to signal name->value dicts.
+
+        The message definition is resolved once for the whole list. Entries
+        are None for payloads that fail to decode (or all of them when the
+        ID is unknown).
+        """
+        msg = self._db.dbc.get_message_by_id(arb_id)
+        if msg is None:
+            return [None] * len(payloads)
+        decode = msg.decode
         result = []
-        for name, value in decoded.items():
-            unit = self._db.get_signal_unit(arb_id, name)
-            result.append(DecodedSignal(name=name, value=value, unit=unit))
+        for data in payloads:
+            try:
+                result.append(decode(data, decode_choices=True))
+            except Exception:
+                result.append(None)
         return result
 
+    def _to_signals(self, arb_id: int, decoded: dict[str, object]) -> list[DecodedSignal]:
+        units = self._db.get_signal_units(arb_id)
+        return [DecodedSignal(name=name, value=value, unit=units.get(name, ""))
+                for name, value in decoded.items()]
+
+    def compile(self, arb_id: int, names: Collection[str] | None = None,
+                ) -> Callable[[bytes], list[tuple[str, str, str]]] | None:
+        """Build a decoder bound to one message definition.
+
+        The returned callable maps raw data to (name, display value, unit)
+        tuples without per-call ID or unit lookups, limited to ``names`` when
+        given. Returns None for unknown IDs; compiled decoders must be rebuilt
+        after databases change.
+        """
+        msg = self._db.dbc.get_message_by_id(arb_id)
+        if msg is None:
+            return None
+        units = self._db.get_signal_units(arb_id)
+        decode = msg.decode
+
+        if names is not None:
+            # Only the requested signals are formatted
+            wanted = [name for name in units if name in names]
+
+            def decode_some(data: bytes) -> list[tuple[str, str, str]]:
+                try:
+                    decoded = decode(data, decode_choices=True)
+                except Exception:
+                    return []
+                return [(name, _display(decoded[name]), units[name])
+                        for name in wanted if name in decoded]
+
+            return decode_some
+
+        def decode_fn(data: bytes) -> list[tuple[str, str, str]]:
+            try:
+                decoded = decode(data, decode_choices=True)
+            except Exception:
+                return []
+            return [(name, _display(value), units.get(name, ""))
+                    for name, value in decoded.items()]
+
+        return decode_fn
+
     def get_symbol(self, arb_id: int) -> str:
         return self._db.get_symbol(arb_id)
 
@@ -75,3 +144,49 @@ class SignalDecoder:
     def encode(self, arb_id: int, signal_data: dict[str, object]) -> bytes | None:
         """Encode signal values into raw CAN data."""
         return self._db.encode(arb_id, signal_data)
+
+    def encode_update(self, arb_id: int, base: bytes, name: str, value: object) -> bytes | None:
+        """Patch a single signal into existing raw data.
+
+        Only the signal's own bits change; the other signals are not
+        re-encoded. Returns None when the signal cannot be patched in place
+        (unknown, float or multiplexed signals, out-of-range values, data of
+        the wrong length); callers then fall back to encode().
+        """
+        msg = self._db.dbc.get_message_by_id(arb_id)
+        if msg is None or msg.is_multiplexed() or len(base) != msg.length:
+            return None
+        sig = next((s for s in msg.signals if s.name == name), None)
+        if sig is None or sig.is_float:
+            return None
+        try:
+            if isinstance(value, str):
+                raw = sig.conversion.choice_to_number(value)
+            else:
+                if ((sig.minimum is not None and value < sig.minimum)
+                        or (sig.maximum is not None and value > sig.maximum)):
+                    return None
+                raw = sig.conversion.numeric_scaled_to_raw(value)
+        except Exception:
+            return None
+
+        length = sig.length
+        if sig.is_signed:
+            if not -(1 << (length - 1)) <= raw < (1 << (length - 1)):
+                return None
+        elif not 0 <= raw < (1 << length):
+            return None
+        mask = (1 << length) - 1
+        raw &= mask
+
+        if sig.byte_order == "little_endian":
+            packed = int.from_bytes(base, "little")
+            shift = sig.start
+            packed = packed & ~(mask << shift) | raw << shift
+            return packed.to_bytes(len(base), "little")
+        # Motorola: start is the MSB in sawtooth numbering
+        msb = 8 * (sig.start // 8) + 7 - sig.start % 8
+        shift = 8 * len(base) - msb - length
+        packed = int.from_bytes(base, "big")
+        packed = packed & ~(mask << shift) | raw << shift
+        return packed.to_bytes(len(base), "big")
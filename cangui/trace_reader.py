@@ -1,13 +1,12 @@
+import mmap
 import re
 from dataclasses import dataclass
 from pathlib import Path
 
-import can
-
 from cangui.can_message import CanMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceEntry:
     number: int
     time_offset: float
@@ -15,15 +14,20 @@ class TraceEntry:
     direction: str  # "Rx" or "Tx"
 
 
+# Matched against the whole (mmap'd) file in one finditer pass, so field
+# separators are restricted to spaces/tabs to keep matches within a line.
+# Possessive quantifiers stop the engine from backtracking into fields
+# that can never match differently.
 _LINE_RE = re.compile(
-    r"\s*(\d+)\)\s+"           # message number
-    r"([\d.]+)\s+"             # time offset
-    r"(\S+)\s+"                # type (1, FD, etc.)
-    r"([0-9A-Fa-f]+)\s+"      # CAN ID
-    r"(Rx|Tx)\s+"              # direction
-    r"d\s+"                    # 'd' marker
-    r"(\d+)\s+"                # DLC
-    r"((?:[0-9A-Fa-f]{2}\s?)*)"  # data bytes
+    rb"^[ \t]*+(\d++)\)[ \t]++"           # message number
+    rb"([\d.]++)[ \t]++"                  # time offset
+    rb"(\S++)[ \t]++"                     # type (1, FD, etc.)
+    rb"([0-9A-Fa-f]++)[ \t]++"            # CAN ID
+    rb"(Rx|Tx)[ \t]++"                    # direction
+    rb"d[ \t]++"                          # 'd' marker
+    rb"(\d++)[ \t]++"                     # DLC
+    rb"((?:[0-9A-Fa-f]{2}[ \t]?)*+)",     # data bytes
+    re.MULTILINE,
 )
 
 
@@ -63,6 +67,7 @@ class TraceReader:
         return self._load_trc()
 
     def _load_blf(self) -> list[TraceEntry]:
+        import can
         self._entries.clear()
         start_time = None
         number = 0
@@ -92,35 +97,31 @@ class TraceReader:
 
     def _load_trc(self) -> list[TraceEntry]:
         self._entries.clear()
-        with open(self._path) as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith(";"):
-                    continue
-                m = _LINE_RE.match(line)
-                if m is None:
-                    continue
-                number = int(m.group(1))
-                time_offset = float(m.group(2))
-                msg_type = m.group(3)
-                can_id = int(m.group(4), 16)
-                direction = m.group(5)
-                dlc = int(m.group(6))
-                data_hex = m.group(7).strip()
-                data = bytes.fromhex(data_hex.replace(" ", "")) if data_hex else b""
-
-                msg = CanMessage(
-                    arbitration_id=can_id,
-                    data=data,
-                    is_extended_id=can_id > 0x7FF,
-                    is_fd=msg_type == "FD",
-                    dlc=dlc,
-                    timestamp=time_offset,
-                )
-                self._entries.append(TraceEntry(
-                    number=number,
-                    time_offset=time_offset,
-                    message=msg,
-                    direction=direction,
-                ))
+        with open(self._path, "rb") as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return self._entries
+            with buf:
+                append = self._entries.append
+                for number, offset, msg_type, can_id, direction, dlc, data_hex \
+                        in (m.groups() for m in _LINE_RE.finditer(buf)):
+                    time_offset = float(offset)
+                    can_id = int(can_id, 16)
+                    # fromhex skips the separating spaces itself, no replace() copy
+                    data = bytes.fromhex(data_hex.decode("ascii"))
+                    msg = CanMessage(
+                        arbitration_id=can_id,
+                        data=data,
+                        is_extended_id=can_id > 0x7FF,
+                        is_fd=msg_type == b"FD",
+                        dlc=int(dlc),
+                        timestamp=time_offset,
+                    )
+                    append(TraceEntry(
+                        number=int(number),
+                        time_offset=time_offset,
+                        message=msg,
+                        direction=direction.decode("ascii"),
+                    ))
         return self._entries
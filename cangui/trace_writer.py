@@ -5,6 +5,12 @@ from pathlib import Path
 from cangui.can_message import CanMessage
 
 
+_WRITE_BUFFER_SIZE = 1 << 20  # 1 MB
+
+# Number) Offset Type ID Rx/Tx d DLC Data
+_LINE_FORMAT = b"  %6d)  %12.3f %2s  %04X  %-2s  d %2d  %s\n"
+
+
 class TraceFormat(Enum):
     TRC = "trc"
     BLF = "blf"
@@ -18,6 +24,7 @@ class TraceWriter:
         self._file = None
         self._start_time: float | None = None
         self._msg_number = 0
+        self._bytes_written = 0
 
     @property
     def path(self) -> Path:
@@ -29,32 +36,33 @@ class TraceWriter:
 
     def open(self):
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = open(self._path, "w")
+        self._file = open(self._path, "wb", buffering=_WRITE_BUFFER_SIZE)
         self._start_time = None
         self._msg_number = 0
+        self._bytes_written = 0
         now = datetime.now()
-        self._file.write(";$FILEVERSION=1.1\n")
-        self._file.write(f";   Start time: {now:%m/%d/%Y %H:%M:%S.%f}\n")
-        self._file.write(
+        header = (
+            ";$FILEVERSION=1.1\n"
+            f";   Start time: {now:%m/%d/%Y %H:%M:%S.%f}\n"
             ";-----------------------------------------------"
             "--------------------------------\n"
-        )
-        self._file.write(
             ";   Message Number) Time Offset   Type   ID"
             "    Rx/Tx   d]  Data Bytes ...\n"
-        )
-        self._file.write(
             ";-----------------------------------------------"
             "--------------------------------\n"
         )
+        self._write(header.encode("ascii"))
+
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self._bytes_written += len(data)
 
     @property
     def file_size(self) -> int:
-        """Return current file size in bytes."""
+        """Return current file size in bytes (including still-buffered data)."""
         if self._file is None:
             return 0
-        self._file.flush()
-        return self._file.tell()
+        return self._bytes_written
 
     @property
     def is_open(self) -> bool:
@@ -67,14 +75,12 @@ class TraceWriter:
             self._start_time = msg.timestamp
         self._msg_number += 1
         offset = msg.timestamp - self._start_time
-        msg_type = "1" if not msg.is_fd else "FD"
-        can_id = f"{msg.arbitration_id:04X}"
-        dlc = len(msg.data)
-        data_str = " ".join(f"{b:02X}" for b in msg.data)
-        self._file.write(
-            f"  {self._msg_number:>6})  {offset:>12.3f} {msg_type:>2}  "
-            f"{can_id}  {direction:<2}  d {dlc:>2}  {data_str}\n"
-        )
+        msg_type = b"1" if not msg.is_fd else b"FD"
+        data = msg.data
+        self._write(_LINE_FORMAT % (
+            self._msg_number, offset, msg_type, msg.arbitration_id,
+            direction.encode("ascii"), len(data), data.hex(" ").upper().encode("ascii"),
+        ))
 
     def close(self):
         if self._file is not None:
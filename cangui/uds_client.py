@@ -1,10 +1,24 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-import can
-import isotp
-import udsoncan
-from udsoncan.client import Client
-from udsoncan.connections import PythonIsoTpConnection
+if TYPE_CHECKING:
+    import can
+    import isotp
+    from udsoncan.client import Client
+    from udsoncan.connections import PythonIsoTpConnection
+
+
+# (bus, tx_id, rx_id) -> ISO-TP stack and connection, reused across open()/close()
+_stack_pool: "dict[tuple[can.BusABC, int, int], tuple[isotp.CanStack, PythonIsoTpConnection]]" = {}
+
+
+def shutdown_pool(bus: "can.BusABC | None" = None):
+    """Drop pooled ISO-TP stacks for the given bus, or all of them."""
+    if bus is None:
+        _stack_pool.clear()
+        return
+    for key in [k for k in _stack_pool if k[0] is bus]:
+        del _stack_pool[key]
 
 
 @dataclass
@@ -26,17 +40,20 @@ class UdsResponse:
 
     @property
     def data_hex(self) -> str:
-        return " ".join(f"{b:02X}" for b in self.data)
+        return self.data.hex(" ").upper()
 
 
 class UdsClient:
     """Wrapper around udsoncan providing a simplified UDS interface."""
 
+    # udsoncan's defaults plus our overrides, built on first open and copied per open
+    _BASE_CLIENT_CONFIG: dict | None = None
+
     def __init__(self):
-        self._bus: can.BusABC | None = None
-        self._stack: isotp.CanStack | None = None
-        self._conn: PythonIsoTpConnection | None = None
-        self._client: Client | None = None
+        self._bus: "can.BusABC | None" = None
+        self._stack: "isotp.CanStack | None" = None
+        self._conn: "PythonIsoTpConnection | None" = None
+        self._client: "Client | None" = None
         self._config = UdsConfig()
 
     @property
@@ -47,28 +64,48 @@ class UdsClient:
     def config(self) -> UdsConfig:
         return self._config
 
-    def open(self, bus: can.BusABC, config: UdsConfig | None = None):
+    def open(self, bus: "can.BusABC", config: UdsConfig | None = None):
         """Open UDS connection on the given python-can bus."""
+        import isotp
+        from udsoncan.client import Client
+        from udsoncan.connections import PythonIsoTpConnection
+
         self.close()
         if config is not None:
             self._config = config
         self._bus = bus
-        addr = isotp.Address(
-            isotp.AddressingMode.Normal_11bits,
-            txid=self._config.tx_id,
-            rxid=self._config.rx_id,
-        )
-        self._stack = isotp.CanStack(bus=self._bus, address=addr)
-        self._conn = PythonIsoTpConnection(self._stack)
-        client_config = dict(udsoncan.configs.default_client_config)
+        # The pool serves address scans on one bus; stacks bound to other buses are stale
+        for key in [k for k in _stack_pool if k[0] is not bus]:
+            del _stack_pool[key]
+        key = (bus, self._config.tx_id, self._config.rx_id)
+        pooled = _stack_pool.get(key)
+        if pooled is None:
+            addr = isotp.Address(
+                isotp.AddressingMode.Normal_11bits,
+                txid=self._config.tx_id,
+                rxid=self._config.rx_id,
+            )
+            stack = isotp.CanStack(bus=bus, address=addr)
+            pooled = _stack_pool[key] = (stack, PythonIsoTpConnection(stack))
+        self._stack, self._conn = pooled
+        client_config = self._base_client_config().copy()
         client_config["request_timeout"] = self._config.timeout
         client_config["p2_timeout"] = self._config.timeout
-        client_config["exception_on_negative_response"] = False
-        client_config["exception_on_invalid_response"] = False
-        client_config["exception_on_unexpected_response"] = False
         self._client = Client(self._conn, config=client_config)
         self._client.open()
 
+    @classmethod
+    def _base_client_config(cls) -> dict:
+        if cls._BASE_CLIENT_CONFIG is None:
+            import udsoncan
+            cls._BASE_CLIENT_CONFIG = {
+                **udsoncan.configs.default_client_config,
+                "exception_on_negative_response": False,
+                "exception_on_invalid_response": False,
+                "exception_on_unexpected_response": False,
+            }
+        return cls._BASE_CLIENT_CONFIG
+
     def close(self):
         if self._client is not None:
             try:
@@ -76,6 +113,7 @@ class UdsClient:
             except Exception:
                 pass
             self._client = None
+        # The stack and connection stay in _stack_pool for the next open()
         self._conn = None
         self._stack = None
         self._bus = None
@@ -124,6 +162,42 @@ class UdsClient:
             return UdsResponse(service_name="ReadDID", success=False,
                                did=did, error=str(e))
 
+    def read_did_raw(self, did: int) -> UdsResponse:
+        """ReadDataByIdentifier (0x22) without udsoncan's DID codecs.
+
+        Returns the record bytes after the 0x62/DID header, for bulk DID scans.
+        """
+        if self._client is None:
+            return UdsResponse(service_name="ReadDID", success=False,
+                               error="Not connected")
+        try:
+            self._conn.send(bytes((0x22, (did >> 8) & 0xFF, did & 0xFF)))
+            while True:
+                payload = self._conn.wait_frame(self._config.timeout)
+                if payload is None:
+                    return UdsResponse(service_name="ReadDID", success=False,
+                                       did=did, error="Timeout")
+                # 0x78: requestCorrectlyReceived-ResponsePending, keep waiting
+                if len(payload) >= 3 and payload[0] == 0x7F and payload[2] == 0x78:
+                    continue
+                break
+            if len(payload) >= 3 and payload[0] == 0x62 \
+                    and payload[1] == (did >> 8) & 0xFF and payload[2] == did & 0xFF:
+                return UdsResponse(service_name="ReadDID", success=True,
+                                   data=bytes(payload[3:]), did=did)
+            if len(payload) >= 3 and payload[0] == 0x7F:
+                from udsoncan import Response
+                nrc = payload[2]
+                nrc_name = Response.Code.get_name(nrc) or ""
+                return UdsResponse(service_name="ReadDID", success=False,
+                                   did=did, nrc=nrc, nrc_name=nrc_name,
+                                   error=f"NRC 0x{nrc:02X}: {nrc_name}")
+            return UdsResponse(service_name="ReadDID", success=False,
+                               did=did, error="Invalid response")
+        except Exception as e:
+            return UdsResponse(service_name="ReadDID", success=False,
+                               did=did, error=str(e))
+
     def write_did(self, did: int, value: bytes) -> UdsResponse:
         """WriteDataByIdentifier (0x2E)."""
         if self._client is None:
@@ -166,12 +240,16 @@ class UdsClient:
             return UdsResponse(service_name="SecurityAccess", success=False,
                                error=str(e))
 
-    def tester_present(self) -> UdsResponse:
-        """TesterPresent (0x3E)."""
+    def tester_present(self, suppress_response: bool = False) -> UdsResponse:
+        """TesterPresent (0x3E), optionally with the positive response suppressed."""
         if self._client is None:
             return UdsResponse(service_name="TesterPresent",
                                success=False, error="Not connected")
         try:
+            if suppress_response:
+                with self._client.suppress_positive_response:
+                    self._client.tester_present()
+                return UdsResponse(service_name="TesterPresent", success=True)
             resp = self._client.tester_present()
             return self._make_response("TesterPresent", resp)
         except Exception as e:
@@ -183,6 +183,7 @@ class MainWindow(QMainWindow):
         self._trace_win.save_trace_requested.connect(self._save_trace)
         self._trace_win.load_trace_requested.connect(self._load_trace)
         self._trace_model.file_changed.connect(self._on_trace_file_changed)
+        self._trace_model.write_error.connect(self._on_trace_write_error)
 
         self._project_win = ProjectWindow(self._project_model)
         self._project_win.add_file_requested.connect(self._import_dbc)
@@ -358,6 +359,7 @@ class MainWindow(QMainWindow):
                 self._project_win.refresh()
                 self._rx_model.refresh_symbols()
                 self._tx_model.refresh_signals()
+                self._watch_model.refresh_decoders()
             except Exception as e:
                 from PySide6.QtWidgets import QMessageBox
                 QMessageBox.warning(self, "Import Error", f"Failed to load database:\n{e}")
@@ -368,6 +370,7 @@ class MainWindow(QMainWindow):
         self._project_win.refresh()
         self._rx_model.refresh_symbols()
         self._tx_model.refresh_signals()
+        self._watch_model.refresh_decoders()
 
     # -- Project management --
 
@@ -589,7 +592,12 @@ class MainWindow(QMainWindow):
     # -- Trace --
 
     def _trace_start(self):
-        self._trace_model.start()
+        try:
+            self._trace_model.start()
+        except OSError as e:
+            from PySide6.QtWidgets import QMessageBox
+            QMessageBox.warning(self, "Trace Error", f"Failed to open trace file:\n{e}")
+            return
         self._trace_win._on_start()
 
     def _trace_pause(self):
@@ -600,6 +608,11 @@ class MainWindow(QMainWindow):
         self._trace_model.stop()
         self._trace_win._on_stop()
 
+    def _on_trace_write_error(self, message: str):
+        self._trace_stop()
+        from PySide6.QtWidgets import QMessageBox
+        QMessageBox.warning(self, "Trace Error", f"Trace recording stopped:\n{message}")
+
     def _sync_trace_folder(self):
         """Update the trace model's output folder from the current project path."""
         self._trace_model.set_trace_folder(self._project.trace_folder)
@@ -780,6 +793,8 @@ class MainWindow(QMainWindow):
             self._trace_player.stop()
         if self._transmitter is not None:
             self._transmitter.stop()
-        self._uds_service.disconnect()
+        self._uds_service.shutdown()
         self._can_service.disconnect_all()
+        self._rx_model.stop()
+        self._trace_model.stop()
         super().closeEvent(event)
@@ -9,6 +9,7 @@ from cangui.model_rx_message import RxMessageModel
 from cangui.model_tx_message import TxMessageModel
 from cangui.model_connection import ConnectionModel, InterfaceDelegate
 from cangui.ui_base_dock_window import BaseDockWindow
+from cangui.widget_static_text_delegate import StaticTextDelegate
 
 
 class SymbolDelegate(QStyledItemDelegate):
@@ -160,6 +161,7 @@ class RxTxWindow(BaseDockWindow):
         self._tx_view.header().setStretchLastSection(True)
         self._tx_view.header().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self._tx_view.setSelectionBehavior(QTreeView.SelectionBehavior.SelectRows)
+        self._tx_view.setItemDelegate(StaticTextDelegate(self._tx_view))
         self._tx_view.setItemDelegateForColumn(4, SymbolDelegate(self._tx_view))
         self._set_default_widths(self._tx_view)
         tx_layout.addWidget(self._tx_view)
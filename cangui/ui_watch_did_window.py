@@ -51,7 +51,7 @@ class DidWatchModel(QAbstractTableModel):
             case 0: return f"0x{entry.did:04X}"
             case 1: return entry.name
             case 2: return entry.value
-            case 3: return " ".join(f"{b:02X}" for b in entry.raw_data)
+            case 3: return entry.raw_data.hex(" ").upper()
             case 4: return entry.cycle_ms
             case 5: return entry.error or "OK" if entry.raw_data else ""
         return None
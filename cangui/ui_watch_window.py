@@ -4,6 +4,7 @@ from PySide6.QtCore import Signal
 
 from cangui.model_watch import WatchModel
 from cangui.ui_base_dock_window import BaseDockWindow
+from cangui.widget_static_text_delegate import StaticTextDelegate
 
 
 class WatchWindow(BaseDockWindow):
@@ -42,6 +43,7 @@ class WatchWindow(BaseDockWindow):
         self._view.header().setStretchLastSection(True)
         self._view.header().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         self._view.setSelectionBehavior(QTreeView.SelectionBehavior.SelectRows)
+        self._view.setItemDelegate(StaticTextDelegate(self._view))
         self._layout.addWidget(self._view)
 
     @property
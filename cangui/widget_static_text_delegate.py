@@ -0,0 +1,86 @@
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPalette, QStaticText, QTransform
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+_NON_TEXT = (QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+          | QStyleOptionViewItem.ViewItemFeature.HasDecoration)
+_CACHE_SIZE = 4096
+
+
+class StaticTextDelegate(QStyledItemDelegate):
+    """Paints plain-text cells from cached QStaticText layouts.
+
+    Layouts are keyed by the displayed string, so a value that comes back
+    (counters, enum states, repeated data) is never shaped twice and model
+    updates need no cache invalidation. The font is part of the key, and
+    the cache is dropped when the device's DPI changes (e.g. the window
+    moved to another screen). Cells with check boxes or icons, and text too
+    wide for its cell (which needs eliding), fall back to the default
+    painting.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache: dict[tuple[str, str], QStaticText] = {}
+        # Device metrics the cached layouts were prepared for
+        self._device_metrics: tuple[int, float] | None = None
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        if not text or opt.features & _NON_TEXT:
+            super().paint(painter, option, index)
+            return
+
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        rect = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, opt, widget)
+        margin = style.pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, None, widget) + 1
+        rect.adjust(margin, 0, -margin, 0)
+
+        static = self._static_text(text, opt, painter)
+        size = static.size()
+        if size.width() > rect.width():
+            super().paint(painter, option, index)
+            return
+
+        # Background, selection and focus frame without the text
+        opt.text = ""
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        align = opt.displayAlignment
+        if align & Qt.AlignmentFlag.AlignRight:
+            x = rect.right() + 1 - size.width()
+        elif align & Qt.AlignmentFlag.AlignHCenter:
+            x = rect.left() + (rect.width() - size.width()) / 2
+        else:
+            x = rect.left()
+        y = rect.top() + (rect.height() - size.height()) / 2
+
+        group = (QPalette.ColorGroup.Normal if opt.state & QStyle.StateFlag.State_Enabled
+                 else QPalette.ColorGroup.Disabled)
+        role = (QPalette.ColorRole.HighlightedText if opt.state & QStyle.StateFlag.State_Selected
+                else QPalette.ColorRole.Text)
+        painter.save()
+        painter.setFont(opt.font)
+        painter.setPen(opt.palette.color(group, role))
+        painter.drawStaticText(QPointF(x, y), static)
+        painter.restore()
+
+    def _static_text(self, text: str, opt: QStyleOptionViewItem, painter) -> QStaticText:
+        device = painter.device()
+        metrics = (device.logicalDpiY(), device.devicePixelRatioF())
+        if metrics != self._device_metrics:
+            self._cache.clear()
+            self._device_metrics = metrics
+        key = (text, opt.font.key())
+        static = self._cache.get(key)
+        if static is None:
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.clear()
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.prepare(QTransform(), opt.font)
+            self._cache[key] = static
+        return static
@@ -8,6 +8,8 @@ from cangui.can_message import CanMessage
 # Emit a batch every BATCH_INTERVAL seconds or when BATCH_MAX messages accumulate
 _BATCH_INTERVAL = 0.020  # 20 ms
 _BATCH_MAX = 500
+# Receive timeout while no batch is pending; bounds how long stop() waits
+_IDLE_TIMEOUT = 0.100  # 100 ms
 
 
 class CanReceiver(QThread):
@@ -24,9 +26,13 @@ class CanReceiver(QThread):
         last_emit = time.monotonic()
 
         while self._running:
-            msg = self._bus.recv(timeout=0.010)
-            if msg is not None:
-                batch.append(msg)
+            # Block in the driver until a frame arrives; with a pending batch,
+            # wake up exactly when it is due instead of polling every few ms
+            if batch:
+                timeout = max(0.0, _BATCH_INTERVAL - (time.monotonic() - last_emit))
+            else:
+                timeout = _IDLE_TIMEOUT
+            batch.extend(self._bus.recv_batch(_BATCH_MAX - len(batch), timeout=timeout))
 
             now = time.monotonic()
             if batch and (now - last_emit >= _BATCH_INTERVAL or len(batch) >= _BATCH_MAX):
@@ -14,11 +14,7 @@ _COUNTER_INTERVAL = 0.200  # 200 ms
 class _TxSnapshot:
     """Immutable snapshot of a TX item for the transmitter thread."""
     row: int
-    can_id: int
-    raw_data: bytes
-    is_extended_id: bool
-    length: int
-    bus: int
+    message: CanMessage  # built once per snapshot and resent every cycle
     cycle_time_ms: int
     cycle_enabled: bool
 
@@ -52,11 +48,13 @@ class CanTransmitter(QThread):
         self._snapshot = [
             _TxSnapshot(
                 row=row,
-                can_id=item.can_id,
-                raw_data=bytes(item.raw_data),
-                is_extended_id=item.is_extended_id,
-                length=item.length,
-                bus=item.bus,
+                message=CanMessage(
+                    arbitration_id=item.can_id,
+                    data=bytes(item.raw_data),
+                    is_extended_id=item.is_extended_id,
+                    dlc=item.length,
+                    bus=item.bus,
+                ),
                 cycle_time_ms=item.cycle_time_ms,
                 cycle_enabled=item.cycle_enabled,
             )
@@ -88,15 +86,8 @@ class CanTransmitter(QThread):
 
                 next_time = timers.get(item.row, 0.0)
                 if now >= next_time:
-                    msg = CanMessage(
-                        arbitration_id=item.can_id,
-                        data=item.raw_data,
-                        is_extended_id=item.is_extended_id,
-                        dlc=item.length,
-                        bus=item.bus,
-                    )
                     try:
-                        self._send(msg)
+                        self._send(item.message)
                         counts[item.row] = counts.get(item.row, 0) + 1
                     except Exception:
                         pass
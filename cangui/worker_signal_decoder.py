@@ -0,0 +1,59 @@
+from collections.abc import Callable, Hashable
+from queue import Empty, SimpleQueue
+
+from PySide6.QtCore import QThread, Signal
+
+# (key, compiled decoder, raw data); the key is returned with the result
+DecodeJob = tuple[Hashable, Callable[[bytes], list[tuple[str, str, str]]], bytes]
+
+
+class SignalDecodeWorker(QThread):
+    """Runs compiled signal decoders (SignalDecoder.compile) off the GUI thread."""
+
+    decoded = Signal(list)  # list[(key, [(name, display value, unit), ...])]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue: SimpleQueue[list[DecodeJob] | None] = SimpleQueue()
+        self._stopped = False
+
+    def submit(self, jobs: list[DecodeJob]):
+        """Queue a batch of jobs and ensure the worker thread is running.
+
+        Ignored after stop(), so late flushes cannot restart the thread.
+        """
+        if self._stopped:
+            return
+        self._queue.put(jobs)
+        if not self.isRunning():
+            self.start()
+
+    def run(self):
+        running = True
+        while running:
+            batch = self._queue.get()
+            if batch is None:
+                break
+            # Merge everything queued meanwhile; only the newest job per key matters
+            jobs = {key: (fn, data) for key, fn, data in batch}
+            while True:
+                try:
+                    batch = self._queue.get_nowait()
+                except Empty:
+                    break
+                if batch is None:
+                    running = False
+                    break
+                jobs.update((key, (fn, data)) for key, fn, data in batch)
+            self.decoded.emit([(key, fn(data)) for key, (fn, data) in jobs.items()])
+
+    def stop(self):
+        """End the thread and wait for it to finish.
+
+        Waits without a timeout: a running QThread must not be destroyed, and
+        the batch being decoded is finite.
+        """
+        self._stopped = True
+        if self.isRunning():
+            self._queue.put(None)
+            self.wait()
@@ -0,0 +1,94 @@
+from pathlib import Path
+from queue import Empty, SimpleQueue
+
+from PySide6.QtCore import QThread, Signal
+
+from cangui.can_message import CanMessage
+from cangui.trace_writer import TraceWriter, TraceFormat, create_trace_writer
+
+
+class TraceDiskWriter(QThread):
+    """Writes recorded messages to trace files on a background thread.
+
+    Files are named ``<base_name>.<ext>``, then ``<base_name>_001.<ext>`` and
+    so on, rolling to the next one once a file reaches ``max_size`` bytes.
+    The first file is opened by the constructor, so errors opening it are
+    raised to the caller; later write errors end the thread and are reported
+    through ``error``.
+    """
+
+    file_changed = Signal(str)  # path of the file now being written, "" when closed
+    error = Signal(str)  # write failed; the file is closed and later batches are dropped
+
+    def __init__(self, folder: Path, base_name: str, fmt: TraceFormat,
+                 max_size: int, parent=None):
+        super().__init__(parent)
+        self._folder = folder
+        self._base_name = base_name
+        self._format = fmt
+        self._max_size = max_size
+        self._queue: SimpleQueue[list[tuple[CanMessage, str]] | None] = SimpleQueue()
+        self._writer = create_trace_writer(self.path, fmt)
+        self._writer.open()
+
+    @property
+    def path(self) -> Path:
+        """Path of the first file."""
+        return self._folder / f"{self._base_name}.{self._format.value}"
+
+    def write_batch(self, batch: list[tuple[CanMessage, str]]):
+        """Queue (message, direction) pairs for writing; dropped once the
+        thread has finished."""
+        if self.isRunning():
+            self._queue.put(batch)
+
+    def run(self):
+        file_index = 0
+        writer = self._writer
+        try:
+            while True:
+                batch = self._queue.get()
+                if batch is None:
+                    break
+                for msg, direction in batch:
+                    if writer.file_size >= self._max_size:
+                        writer.close()
+                        file_index += 1
+                        writer = self._open(self._folder / (
+                            f"{self._base_name}_{file_index:03d}.{self._format.value}"))
+                    writer.write(msg, direction=direction)
+        except Exception as e:
+            self.error.emit(str(e))
+            self._discard_queued()
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+            self.file_changed.emit("")
+
+    def _open(self, path: Path) -> TraceWriter:
+        writer = create_trace_writer(path, self._format)
+        writer.open()
+        self.file_changed.emit(str(path))
+        return writer
+
+    def _discard_queued(self):
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+
+    def stop(self):
+        """Write everything queued so far, close the file and end the thread.
+
+        Blocks until the queue is written: recorded data is never dropped on
+        stop, so a slow disk delays the caller rather than losing the trace.
+        """
+        if self.isRunning():
+            self._queue.put(None)
+            self.wait()
+        else:
+            # Never started: close the file opened by the constructor
+            self._writer.close()
@@ -26,6 +26,7 @@ class UdsRequest:
     data: bytes = b""
     security_level: int = 0x01
     seed_key_func: object = None  # callable(seed, level) -> key
+    suppress_response: bool = False  # keepalive: no reply, nothing emitted on success
 
 
 class UdsWorker(QThread):
@@ -72,7 +73,9 @@ class UdsWorker(QThread):
                             req.security_level, req.seed_key_func
                         )
                     case UdsRequestType.TESTER_PRESENT:
-                        resp = self._client.tester_present()
+                        resp = self._client.tester_present(req.suppress_response)
+                        if req.suppress_response and resp.success:
+                            continue
                     case UdsRequestType.RAW_REQUEST:
                         resp = self._client.raw_request(req.data)
                     case _: